@@ -1,10 +1,13 @@
 """Constitution management utility commands for agents."""
 
 import json
+from pathlib import Path
+from typing import Any
 
 import typer
 
 from open_agent_kit.config.messages import ERROR_MESSAGES, INFO_MESSAGES, SUCCESS_MESSAGES
+from open_agent_kit.models.validation import ValidationResult
 from open_agent_kit.services.agent_file_service import AgentFileService
 from open_agent_kit.services.constitution_service import ConstitutionService
 from open_agent_kit.services.validation_service import ValidationService
@@ -395,49 +398,12 @@ def validate(
 
         constitution = constitution_service.load()
         result = validation_service.validate(constitution)
-        raw_category_counts = result.stats.get("category_counts", {})
-        raw_priority_counts = result.stats.get("priority_counts", {})
-        # Ensure we have dict types
-        category_counts: dict[str, int] = (
-            raw_category_counts if isinstance(raw_category_counts, dict) else {}
-        )
-        priority_counts: dict[str, int] = (
-            raw_priority_counts if isinstance(raw_priority_counts, dict) else {}
-        )
-
-        focus_areas: list[str] = []
-        if category_counts.get("quality"):
-            focus_areas.append(f"quality ({category_counts['quality']})")
-        if category_counts.get("consistency"):
-            focus_areas.append(f"consistency ({category_counts['consistency']})")
-        if category_counts.get("structure"):
-            focus_areas.append(f"structure ({category_counts['structure']})")
-
-        summary_text = (
-            "No issues detected. Lead with your own qualitative assessment before relying on this output."
-            if result.is_valid
-            else (
-                "Focus areas: " + ", ".join(focus_areas)
-                if focus_areas
-                else "Issues detected. Review categories below and synthesize your own remediation plan."
-            )
-        )
+        output = gather_validation_data(result)
+        focus_areas: list[str] = output["summary"]["focus_areas"]
+        category_counts: dict[str, int] = output["summary"]["category_counts"]
 
         if json_output:
             # Output JSON for agent parsing
-            output = {
-                "is_valid": result.is_valid,
-                "issues": [issue.to_dict() for issue in result.issues],
-                "stats": result.stats,
-                "summary": {
-                    "text": summary_text,
-                    "total_issues": result.total_issues,
-                    "priority_counts": priority_counts,
-                    "category_counts": category_counts,
-                    "focus_areas": focus_areas,
-                    "guidance": "This validator uses pattern-matching heuristics (keyword detection, sentence counting) rather than semantic content analysis. Use findings as supporting evidence, not definitive judgments.",
-                },
-            }
             print(json.dumps(output, indent=2))
         else:
             # Human-readable output
@@ -657,13 +623,11 @@ def list_agent_files(
         raise typer.Exit(code=1)
 
     try:
-        service = AgentFileService.from_config(project_root)
-        agent_files = service.list_agent_files()
+        agent_files = gather_agent_files_data(project_root)
 
         if json_output:
             # Output JSON for agent parsing
-            output = {agent: str(path) if path else None for agent, path in agent_files.items()}
-            print(json.dumps(output, indent=2))
+            print(json.dumps(agent_files, indent=2))
         else:
             # Human-readable output
             print("Agent instruction files:")
@@ -757,16 +721,11 @@ def generate_agent_files(
         print_info(INFO_MESSAGES["generating_agent_files"])
 
     try:
-        constitution_service = ConstitutionService.from_config(project_root)
-        agent_service = AgentFileService.from_config(project_root)
-
-        constitution = constitution_service.load()
-        generated = agent_service.generate_agent_files(constitution)
+        generated = generate_agent_files_data(project_root)
 
         if json_output:
             # Output JSON for agent parsing
-            output = {agent: str(path) for agent, path in generated.items()}
-            print(json.dumps(output, indent=2))
+            print(json.dumps(generated, indent=2))
         else:
             # Print generated files to stdout
             for agent, path in generated.items():
@@ -1103,3 +1062,89 @@ def analyze(
     except Exception as e:
         print_error(f"Error analyzing project: {e}")
         raise typer.Exit(code=1)
+
+
+def gather_validation_data(result: ValidationResult) -> dict[str, Any]:
+    """Build the validate command's report from a validation result.
+
+    Args:
+        result: Validation result for the constitution
+
+    Returns:
+        JSON-serializable report with issues, stats and a summary
+    """
+    raw_category_counts = result.stats.get("category_counts", {})
+    raw_priority_counts = result.stats.get("priority_counts", {})
+    # Ensure we have dict types
+    category_counts: dict[str, int] = (
+        raw_category_counts if isinstance(raw_category_counts, dict) else {}
+    )
+    priority_counts: dict[str, int] = (
+        raw_priority_counts if isinstance(raw_priority_counts, dict) else {}
+    )
+
+    focus_areas: list[str] = []
+    if category_counts.get("quality"):
+        focus_areas.append(f"quality ({category_counts['quality']})")
+    if category_counts.get("consistency"):
+        focus_areas.append(f"consistency ({category_counts['consistency']})")
+    if category_counts.get("structure"):
+        focus_areas.append(f"structure ({category_counts['structure']})")
+
+    summary_text = (
+        "No issues detected. Lead with your own qualitative assessment before relying on this output."
+        if result.is_valid
+        else (
+            "Focus areas: " + ", ".join(focus_areas)
+            if focus_areas
+            else "Issues detected. Review categories below and synthesize your own remediation plan."
+        )
+    )
+
+    return {
+        "is_valid": result.is_valid,
+        "issues": [issue.to_dict() for issue in result.issues],
+        "stats": result.stats,
+        "summary": {
+            "text": summary_text,
+            "total_issues": result.total_issues,
+            "priority_counts": priority_counts,
+            "category_counts": category_counts,
+            "focus_areas": focus_areas,
+            "guidance": "This validator uses pattern-matching heuristics (keyword detection, sentence counting) rather than semantic content analysis. Use findings as supporting evidence, not definitive judgments.",
+        },
+    }
+
+
+def gather_agent_files_data(project_root: Path) -> dict[str, str | None]:
+    """Gather agent instruction file paths for detected agents.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Dictionary mapping agent type to file path, or None if not found
+    """
+    service = AgentFileService.from_config(project_root)
+    agent_files = service.list_agent_files()
+    return {agent: str(path) if path else None for agent, path in agent_files.items()}
+
+
+def generate_agent_files_data(project_root: Path) -> dict[str, str]:
+    """Generate agent instruction files from the constitution.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Dictionary mapping agent type to generated file path
+
+    Raises:
+        FileNotFoundError: If constitution doesn't exist
+    """
+    constitution_service = ConstitutionService.from_config(project_root)
+    agent_service = AgentFileService.from_config(project_root)
+
+    constitution = constitution_service.load()
+    generated = agent_service.generate_agent_files(constitution)
+    return {agent: str(path) for agent, path in generated.items()}
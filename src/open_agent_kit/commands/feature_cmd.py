@@ -1,5 +1,6 @@
 """Feature management commands for open-agent-kit."""
 
+import json
 from pathlib import Path
 
 import typer
@@ -51,7 +52,11 @@ def feature_interactive(ctx: typer.Context) -> None:
 
 
 @feature_app.command("list")
-def feature_list() -> None:
+def feature_list(
+    json_output: bool = typer.Option(
+        False, "--json", help="Output JSON summary instead of formatted text"
+    ),
+) -> None:
     """List all available features and their installation status."""
     project_root = Path.cwd()
     feature_service = FeatureService(project_root)
@@ -63,6 +68,24 @@ def feature_list() -> None:
 
     installed = set(feature_service.list_installed_features())
 
+    if json_output:
+        features = []
+        for feature_name in SUPPORTED_FEATURES:
+            manifest = feature_service.get_feature_manifest(feature_name)
+            if not manifest:
+                continue
+            features.append(
+                {
+                    "name": feature_name,
+                    "display_name": manifest.display_name,
+                    "installed": feature_name in installed,
+                    "dependencies": manifest.dependencies,
+                    "description": manifest.description,
+                }
+            )
+        print(json.dumps({"features": features}, indent=2))
+        return
+
     # Create table
     table = Table(title="OAK Features")
     table.add_column("Feature", style="cyan")
@@ -6,6 +6,7 @@ with research phases, task generation, and issue export.
 
 from __future__ import annotations
 
+import json
 import re
 import subprocess
 from pathlib import Path
@@ -288,6 +289,9 @@ def plan_from_issue(
 @plan_app.command("show")
 def show_plan(
     name: str | None = typer.Argument(None, help="Plan name (inferred from branch if omitted)"),
+    json_output: bool = typer.Option(
+        False, "--json", help="Output JSON summary instead of formatted text"
+    ),
 ) -> None:
     """Show plan status and artifact paths.
 
@@ -296,6 +300,7 @@ def show_plan(
     Examples:
         oak plan show auth-redesign
         oak plan show  # Uses current branch
+        oak plan show auth-redesign --json
     """
     project_root = get_project_root()
     if not project_root:
@@ -320,6 +325,16 @@ def show_plan(
     # Get research status
     research_status = service.get_research_status(plan_name)
 
+    if json_output:
+        output = {
+            "manifest": plan.manifest.model_dump(mode="json"),
+            "research": research_status,
+            "task_count": len(plan.tasks),
+            "plan_file": str(service.get_plan_file_path(plan_name)),
+        }
+        print(json.dumps(output, indent=2))
+        return
+
     # Format research progress
     research_progress = (
         f"{research_status['completed']}/{research_status['total']} topics completed"
@@ -403,11 +418,16 @@ def show_plan(
 
 
 @plan_app.command("list")
-def list_plans() -> None:
+def list_plans(
+    json_output: bool = typer.Option(
+        False, "--json", help="Output JSON summary instead of formatted text"
+    ),
+) -> None:
     """List all plans with their status.
 
     Examples:
         oak plan list
+        oak plan list --json
     """
     project_root = get_project_root()
     if not project_root:
@@ -417,6 +437,11 @@ def list_plans() -> None:
     service = PlanService(project_root)
     plans = service.list_plans()
 
+    if json_output:
+        output = {"plans": [plan.model_dump(mode="json") for plan in plans]}
+        print(json.dumps(output, indent=2))
+        return
+
     if not plans:
         print_info(PLAN_INFO_MESSAGES["no_plans"])
         return
@@ -450,12 +475,16 @@ def list_plans() -> None:
 @plan_app.command("research")
 def show_research(
     name: str | None = typer.Argument(None, help="Plan name (inferred from branch if omitted)"),
+    json_output: bool = typer.Option(
+        False, "--json", help="Output JSON summary instead of formatted text"
+    ),
 ) -> None:
     """Show research status for a plan.
 
     Examples:
         oak plan research auth-redesign
         oak plan research  # Uses current branch
+        oak plan research auth-redesign --json
     """
     project_root = get_project_root()
     if not project_root:
@@ -477,6 +506,10 @@ def show_research(
         print_error(PLAN_ERROR_MESSAGES["plan_not_found"].format(name=plan_name))
         raise typer.Exit(code=1)
 
+    if json_output:
+        print(json.dumps({"plan": plan_name, **status}, indent=2))
+        return
+
     if status["total"] == 0:
         print_info(PLAN_INFO_MESSAGES["no_research_topics"].format(name=plan_name))
         return
@@ -510,12 +543,16 @@ def show_research(
 @plan_app.command("tasks")
 def show_tasks(
     name: str | None = typer.Argument(None, help="Plan name (inferred from branch if omitted)"),
+    json_output: bool = typer.Option(
+        False, "--json", help="Output JSON summary instead of formatted text"
+    ),
 ) -> None:
     """Show tasks for a plan.
 
     Examples:
         oak plan tasks auth-redesign
         oak plan tasks  # Uses current branch
+        oak plan tasks auth-redesign --json
     """
     project_root = get_project_root()
     if not project_root:
@@ -537,6 +574,11 @@ def show_tasks(
         print_error(PLAN_ERROR_MESSAGES["plan_not_found"].format(name=plan_name))
         raise typer.Exit(code=1)
 
+    if json_output:
+        output = {"plan": plan_name, "tasks": [task.model_dump(mode="json") for task in tasks]}
+        print(json.dumps(output, indent=2))
+        return
+
     if not tasks:
         print_info(PLAN_INFO_MESSAGES["no_tasks"].format(name=plan_name))
         return
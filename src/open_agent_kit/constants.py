@@ -115,14 +115,14 @@ VALIDATION_STOPWORDS = frozenset(
 # Constitution sections
 # Note: "Metadata" is NOT in this list because it's parsed separately
 # and validated via _validate_metadata() in validation_service.py
-CONSTITUTION_REQUIRED_SECTIONS = [
+CONSTITUTION_REQUIRED_SECTIONS = (
     "Principles",
     "Architecture",
     "Code Standards",
     "Testing",
     "Documentation",
     "Governance",
-]
+)
 
 # Constitution metadata
 CONSTITUTION_METADATA_PROJECT_NAME = "project_name"
@@ -130,38 +130,39 @@ CONSTITUTION_METADATA_VERSION = "version"
 CONSTITUTION_METADATA_RATIFICATION_DATE = "ratification_date"
 CONSTITUTION_METADATA_LAST_AMENDMENT = "last_amendment"
 
-CONSTITUTION_REQUIRED_METADATA = [
+CONSTITUTION_REQUIRED_METADATA = (
     CONSTITUTION_METADATA_PROJECT_NAME,
     CONSTITUTION_METADATA_VERSION,
     CONSTITUTION_METADATA_RATIFICATION_DATE,
-]
+)
 
 CONSTITUTION_METADATA_OPTIONAL = [
     CONSTITUTION_METADATA_LAST_AMENDMENT,
 ]
 
 # Regex patterns
-CONSTITUTION_VERSION_PATTERN = r"^\d+\.\d+\.\d+$"
-CONSTITUTION_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+CONSTITUTION_VERSION_PATTERN = r"^(\d+)\.(\d+)\.(\d+)$"
 RFC_NUMBER_PATTERN = r"^(?:RFC-)?(\d{3,4}|20\d{2}-\d{3})$"
 RFC_FILENAME_PATTERN = r"^RFC-(\d{3,4}|20\d{2}-\d{3})-(.+)\.md$"
 
 # Quality heuristics
-CONSTITUTION_NORMATIVE_SECTIONS = [
-    "Principles",
-    "Architecture",
-    "Code Standards",
-    "Testing",
-    "Governance",
-]
+CONSTITUTION_NORMATIVE_SECTIONS = frozenset(
+    {
+        "Principles",
+        "Architecture",
+        "Code Standards",
+        "Testing",
+        "Governance",
+    }
+)
 
-CONSTITUTION_NORMATIVE_KEYWORDS = [
+CONSTITUTION_NORMATIVE_KEYWORDS = (
     "MUST",
     "MUST NOT",
     "SHALL",
     "SHALL NOT",
     "MAY",
-]
+)
 
 CONSTITUTION_VAGUE_POLICY_PATTERNS = [
     r"\btry to\b",
@@ -218,14 +219,14 @@ REQUIRED_RFC_SECTIONS = [
 ]
 
 # Constitution tokens
-CONSTITUTION_TOKENS = [
+CONSTITUTION_TOKENS = (
     "{{PROJECT_NAME}}",
     "{{PROJECT_DESCRIPTION}}",
     "{{VERSION}}",
     "{{DATE}}",
     "{{AUTHOR}}",
     "{{TECH_STACK}}",
-]
+)
 
 # =============================================================================
 # Constitution Decision Context
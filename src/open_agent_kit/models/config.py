@@ -160,65 +160,86 @@ class OakConfig(BaseModel):
         """
         import yaml
 
+        # Imported here: open_agent_kit.utils imports constants, which imports models
+        from open_agent_kit.utils.file_utils import YAML_SAFE_LOADER
+
         if not config_path.exists():
             return cls()
 
         with open(config_path) as f:
-            data = yaml.safe_load(f)
-            if not data:
-                return cls()
-
-            # Migration: Convert old 'agent: str' to new 'agents: list[str]'
-            if "agent" in data and "agents" not in data:
-                agent_value = data.pop("agent")
-                if agent_value and agent_value != "none":
-                    data["agents"] = [agent_value]
-                else:
-                    data["agents"] = []
-
-            # Convert agent_capabilities dict entries to AgentCapabilitiesConfig
-            if "agent_capabilities" in data and isinstance(data["agent_capabilities"], dict):
-                data["agent_capabilities"] = {
-                    agent: AgentCapabilitiesConfig(**caps) if isinstance(caps, dict) else caps
-                    for agent, caps in data["agent_capabilities"].items()
+            data = yaml.load(f, Loader=YAML_SAFE_LOADER)
+        if not data:
+            return cls()
+        return cls.from_dict(data, config_path)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], config_path: Path) -> "OakConfig":
+        """Create configuration from parsed config.yaml data.
+
+        Applies the same migrations as ``load`` without reading the file again.
+
+        Args:
+            data: Parsed YAML mapping (not modified)
+            config_path: Path the data was read from, used to infer features
+                from installed commands when the features section is missing
+
+        Returns:
+            OakConfig instance
+        """
+        data = dict(data)
+
+        # Migration: Convert old 'agent: str' to new 'agents: list[str]'
+        if "agent" in data and "agents" not in data:
+            agent_value = data.pop("agent")
+            if agent_value and agent_value != "none":
+                data["agents"] = [agent_value]
+            else:
+                data["agents"] = []
+
+        # Convert agent_capabilities dict entries to AgentCapabilitiesConfig
+        if "agent_capabilities" in data and isinstance(data["agent_capabilities"], dict):
+            data["agent_capabilities"] = {
+                agent: AgentCapabilitiesConfig(**caps) if isinstance(caps, dict) else caps
+                for agent, caps in data["agent_capabilities"].items()
+            }
+
+        # Migration: Infer enabled features from installed commands
+        if "features" not in data:
+            enabled_features = set()
+            claude_dir = config_path.parent.parent / ".claude"
+            commands_dir = claude_dir / "commands"
+
+            if commands_dir.exists():
+                # Map command prefixes to feature names
+                command_prefix_map = {
+                    "oak.rfc-": "rfc",
+                    "oak.constitution-": "constitution",
+                    "oak.issue-": "issues",
                 }
 
-            # Migration: Infer enabled features from installed commands
-            if "features" not in data:
-                enabled_features = set()
-                claude_dir = config_path.parent.parent / ".claude"
-                commands_dir = claude_dir / "commands"
-
-                if commands_dir.exists():
-                    # Map command prefixes to feature names
-                    command_prefix_map = {
-                        "oak.rfc-": "rfc",
-                        "oak.constitution-": "constitution",
-                        "oak.issue-": "issues",
-                    }
-
-                    # Scan for command files to infer features
-                    for cmd_file in commands_dir.glob("oak.*.md"):
-                        cmd_name = cmd_file.name
-                        for prefix, feature in command_prefix_map.items():
-                            if cmd_name.startswith(prefix):
-                                enabled_features.add(feature)
-                                break
-
-                # Add dependencies for inferred features
-                # constitution is a dependency of rfc and issues
-                if "rfc" in enabled_features or "issues" in enabled_features:
-                    enabled_features.add("constitution")
-
-                data["features"] = {"enabled": sorted(enabled_features)}
-
-            return cls(**data)
+                # Scan for command files to infer features
+                for cmd_file in commands_dir.glob("oak.*.md"):
+                    cmd_name = cmd_file.name
+                    for prefix, feature in command_prefix_map.items():
+                        if cmd_name.startswith(prefix):
+                            enabled_features.add(feature)
+                            break
+
+            # Add dependencies for inferred features
+            # constitution is a dependency of rfc and issues
+            if "rfc" in enabled_features or "issues" in enabled_features:
+                enabled_features.add("constitution")
+
+            data["features"] = {"enabled": sorted(enabled_features)}
+
+        return cls(**data)
 
     def save(self, config_path: Path) -> None:
         """Save configuration to file."""
+        from open_agent_kit.utils.file_utils import YAML_SAFE_DUMPER
 
         # Custom representer to keep short lists inline (more readable)
-        class InlineListDumper(yaml.SafeDumper):
+        class InlineListDumper(YAML_SAFE_DUMPER):  # type: ignore[valid-type,misc]
             pass
 
         def represent_list(dumper: yaml.SafeDumper, data: list[Any]) -> yaml.nodes.Node:
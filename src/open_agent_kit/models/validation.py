@@ -93,6 +93,13 @@ class ValidationResult:
         self.issues.append(issue)
         self.is_valid = False
 
+    def extend_issues(self, issues: list[ValidationIssue]) -> None:
+        """Add a batch of validation issues collected by a single check."""
+        if not issues:
+            return
+        self.issues.extend(issues)
+        self.is_valid = False
+
     def get_issues_by_priority(self, priority: ValidationPriority) -> list[ValidationIssue]:
         """Get issues filtered by priority."""
         return [issue for issue in self.issues if issue.priority == priority]
@@ -10,7 +10,13 @@ from open_agent_kit.models.constitution import ConstitutionDocument
 from open_agent_kit.services.agent_service import AgentService
 from open_agent_kit.services.config_service import ConfigService
 from open_agent_kit.services.template_service import TemplateService
-from open_agent_kit.utils import ensure_dir, file_exists, read_file, write_file
+from open_agent_kit.utils import (
+    YAML_SAFE_LOADER,
+    ensure_dir,
+    file_exists,
+    read_file,
+    write_file,
+)
 
 
 class AgentFileService:
@@ -40,7 +46,7 @@ class AgentFileService:
         if file_exists(self.config_path):
             try:
                 config_content = read_file(self.config_path)
-                config = yaml.safe_load(config_content)
+                config = yaml.load(config_content, Loader=YAML_SAFE_LOADER)
                 configured_agents = config.get("agents", [])
                 installed_agents.extend(configured_agents)
             except Exception:
@@ -11,8 +11,11 @@ Lifecycle:
 """
 
 import os
+import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from open_agent_kit.models.agent_manifest import AgentManifest
 from open_agent_kit.services.config_service import ConfigService
@@ -25,6 +28,51 @@ from open_agent_kit.utils import (
     write_file,
 )
 
+# Markers indicating an instruction file already references the constitution,
+# matched case-insensitively anywhere in the file. "# Project Constitution" also
+# covers deeper heading levels and "oak/constitution.md" covers ".oak/" paths.
+CONSTITUTION_REFERENCE_MARKERS = (
+    "# Project Constitution",
+    "oak/constitution.md",
+    "See constitution:",
+    "Constitution file:",
+    "[constitution]",
+)
+# Every marker contains this keyword, so content without it can be rejected early
+CONSTITUTION_REFERENCE_KEYWORD = "constitution"
+# Searched against lowercased content; much faster than an IGNORECASE pattern
+CONSTITUTION_REFERENCE_PATTERN = re.compile(
+    "|".join(re.escape(marker.lower()) for marker in CONSTITUTION_REFERENCE_MARKERS)
+)
+
+# Instruction file path relative to the project root, keyed by
+# (package agents dir, agent type) and filled lazily from agent manifests
+_INSTRUCTION_FILE_TABLE: dict[tuple[Path, str], str | None] = {}
+
+# Manifest-derived template contexts and capability configs, keyed and filled the
+# same way; callers get copies so config overrides never reach the shared entry
+_AGENT_CONTEXT_TABLE: dict[tuple[Path, str], dict[str, Any]] = {}
+_CAPABILITIES_TABLE: dict[tuple[Path, str], dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=32)
+def _relative_constitution_path(agent_dir: Path, constitution_path: Path) -> str:
+    """Get the POSIX-style link from an agent file's directory to the constitution.
+
+    Args:
+        agent_dir: Directory containing the agent instruction file
+        constitution_path: Path to constitution.md file
+
+    Returns:
+        Relative path, or the constitution path itself when no relative path
+        exists (e.g. different drives on Windows)
+    """
+    try:
+        relative_path = os.path.relpath(constitution_path, agent_dir)
+    except ValueError:
+        relative_path = str(constitution_path)
+    return relative_path.replace("\\", "/")
+
 
 class AgentService:
     """Service for managing AI agent configurations and commands.
@@ -166,12 +214,15 @@ class AgentService:
             >>> context['has_native_web']
             False
         """
-        manifest = self.get_agent_manifest(agent_type)
-        context = manifest.get_template_context()
+        agent_key = agent_type.lower()
+        table_key = (self.package_agents_dir, agent_key)
+        if table_key not in _AGENT_CONTEXT_TABLE:
+            manifest = self.get_agent_manifest(agent_key)
+            _AGENT_CONTEXT_TABLE[table_key] = manifest.get_template_context()
+        context = dict(_AGENT_CONTEXT_TABLE[table_key])
 
         # Apply config overrides if present
         config = self.config_service.load_config()
-        agent_key = agent_type.lower()
 
         if agent_key in config.agent_capabilities:
             overrides = config.agent_capabilities[agent_key]
@@ -221,19 +272,21 @@ class AgentService:
         Returns:
             Dictionary with capability values suitable for config.yaml
         """
-        manifest = self.get_agent_manifest(agent_type)
-        caps = manifest.capabilities
-        return {
-            "has_background_agents": caps.has_background_agents,
-            "background_agent_instructions": caps.background_agent_instructions,
-            "has_native_web": caps.has_native_web,
-            "has_mcp": caps.has_mcp,
-            "research_strategy": caps.research_strategy,
-            # Capability tiers for adaptive prompts
-            "reasoning_tier": caps.reasoning_tier,
-            "context_handling": caps.context_handling,
-            "model_consistency": caps.model_consistency,
-        }
+        table_key = (self.package_agents_dir, agent_type.lower())
+        if table_key not in _CAPABILITIES_TABLE:
+            caps = self.get_agent_manifest(agent_type).capabilities
+            _CAPABILITIES_TABLE[table_key] = {
+                "has_background_agents": caps.has_background_agents,
+                "background_agent_instructions": caps.background_agent_instructions,
+                "has_native_web": caps.has_native_web,
+                "has_mcp": caps.has_mcp,
+                "research_strategy": caps.research_strategy,
+                # Capability tiers for adaptive prompts
+                "reasoning_tier": caps.reasoning_tier,
+                "context_handling": caps.context_handling,
+                "model_consistency": caps.model_consistency,
+            }
+        return dict(_CAPABILITIES_TABLE[table_key])
 
     def get_command_filename(self, agent_type: str, command_name: str) -> str:
         """Get the full command filename for an agent.
@@ -278,11 +331,17 @@ class AgentService:
             copilot -> .github/copilot-instructions.md
             cursor -> .cursor/rules.md
         """
-        manifest = self.get_agent_manifest(agent_type)
-        instruction_path = manifest.get_instruction_file_path()
-        if instruction_path:
-            return self.project_root / instruction_path
-        return None
+        agent_type = agent_type.lower()
+
+        # Manifests are static package data, so the relative path is shared by
+        # every service instance; only the join with project_root is per instance
+        table_key = (self.package_agents_dir, agent_type)
+        if table_key not in _INSTRUCTION_FILE_TABLE:
+            manifest = self.get_agent_manifest(agent_type)
+            _INSTRUCTION_FILE_TABLE[table_key] = manifest.get_instruction_file_path()
+        instruction_path = _INSTRUCTION_FILE_TABLE[table_key]
+
+        return self.project_root / instruction_path if instruction_path else None
 
     def create_agent_commands_dir(self, agent_type: str) -> Path:
         """Create native commands directory for an agent.
@@ -481,6 +540,8 @@ class AgentService:
         """
         configured_agents = self.get_agents_from_config()
         detection_results = {}
+        # Agents can share an instruction file (e.g. AGENTS.md), so scan each path once
+        file_info: dict[Path, dict] = {}
 
         for agent_type in configured_agents:
             agent_type = agent_type.lower()
@@ -490,58 +551,44 @@ class AgentService:
                 if instruction_path is None:
                     continue
 
-                exists = instruction_path.exists()
+                if instruction_path not in file_info:
+                    file_info[instruction_path] = self._detect_instruction_file(instruction_path)
 
-                content = None
-                has_constitution_ref = False
-                if exists:
-                    try:
-                        content = read_file(instruction_path)
-                        has_constitution_ref = self._has_constitution_reference(instruction_path)
-                    except Exception:
-                        content = None
-
-                detection_results[agent_type] = {
-                    "exists": exists,
-                    "path": instruction_path,
-                    "content": content,
-                    "has_constitution_ref": has_constitution_ref,
-                }
+                detection_results[agent_type] = dict(file_info[instruction_path])
 
             except ValueError:
                 continue
 
         return detection_results
 
-    def _has_constitution_reference(self, file_path: Path) -> bool:
-        """Check if instruction file already references constitution."""
-        if not file_path.exists():
-            return False
-
+    def _detect_instruction_file(self, instruction_path: Path) -> dict:
+        """Read an instruction file and report whether it references constitution."""
+        # Read directly rather than exists() + read so each file costs one open
+        exists = True
+        content = None
+        has_constitution_ref = False
         try:
-            content = read_file(file_path)
-
-            constitution_markers = [
-                "## Project Constitution",
-                "# Project Constitution",
-                "### Project Constitution",
-                "oak/constitution.md",
-                ".oak/constitution.md",
-                "See constitution:",
-                "Constitution file:",
-                "[constitution]",
-                "[Constitution]",
-            ]
-
-            content_lower = content.lower()
-            for marker in constitution_markers:
-                if marker.lower() in content_lower:
-                    return True
+            content = instruction_path.read_text(encoding="utf-8")
+            has_constitution_ref = self._content_has_constitution_reference(content)
+        except FileNotFoundError:
+            exists = False
+        except Exception:
+            content = None
 
-            return False
+        return {
+            "exists": exists,
+            "path": instruction_path,
+            "content": content,
+            "has_constitution_ref": has_constitution_ref,
+        }
 
-        except Exception:
+    @staticmethod
+    def _content_has_constitution_reference(content: str) -> bool:
+        """Check if already-loaded instruction file content references constitution."""
+        content_lower = content.lower()
+        if CONSTITUTION_REFERENCE_KEYWORD not in content_lower:
             return False
+        return CONSTITUTION_REFERENCE_PATTERN.search(content_lower) is not None
 
     def update_agent_instructions_from_constitution(
         self, constitution_path: Path, mode: str = "additive"
@@ -579,6 +626,7 @@ class AgentService:
                     "path": file_path,
                     "agents": [],
                     "exists": info["exists"],
+                    "content": info["content"],
                     "has_constitution_ref": info["has_constitution_ref"],
                 }
 
@@ -602,7 +650,9 @@ class AgentService:
                     continue
 
                 if exists:
-                    backup_path = self._append_constitution_reference(file_path, constitution_path)
+                    backup_path = self._append_constitution_reference(
+                        file_path, constitution_path, file_info["content"]
+                    )
                     results["backed_up"].append(str(backup_path))
                     for agent in agents:
                         results["updated"].append(agent)
@@ -617,23 +667,33 @@ class AgentService:
 
         return results
 
-    def _append_constitution_reference(self, file_path: Path, constitution_path: Path) -> Path:
-        """Append constitution reference to existing file."""
-        backup_path = file_path.with_suffix(file_path.suffix + ".backup")
-        shutil.copy2(file_path, backup_path)
+    def _append_constitution_reference(
+        self, file_path: Path, constitution_path: Path, existing_content: str | None = None
+    ) -> Path:
+        """Append constitution reference to existing file.
 
-        existing_content = read_file(file_path)
+        Args:
+            file_path: Path to the existing agent instruction file
+            constitution_path: Path to constitution.md file
+            existing_content: Current file content if already read (read from disk if None)
 
-        try:
-            relative_path = os.path.relpath(constitution_path, file_path.parent)
-            relative_path = relative_path.replace("\\", "/")
-        except ValueError:
-            relative_path = str(constitution_path).replace("\\", "/")
+        Returns:
+            Path to the backup of the original file
+        """
+        backup_path = file_path.with_name(file_path.name + ".backup")
+        if existing_content is None:
+            existing_content = read_file(file_path)
+
+        relative_path = _relative_constitution_path(file_path.parent, constitution_path)
 
         reference_text = self._get_constitution_reference_template(relative_path)
         updated_content = existing_content.rstrip() + "\n\n" + reference_text
 
-        write_file(file_path, updated_content)
+        # Copy the backup and write into the original path so symlinked instruction
+        # files (e.g. AGENTS.md -> CLAUDE.md), hardlinks and ownership are kept. The
+        # parent directory already exists, so write directly rather than via write_file.
+        shutil.copy2(file_path, backup_path)
+        file_path.write_text(updated_content, encoding="utf-8")
 
         # Record that we modified this file (existed before oak)
         self.state_service.record_modified_file(
@@ -650,11 +710,7 @@ class AgentService:
         """Create new agent instruction file with constitution reference."""
         ensure_dir(file_path.parent)
 
-        try:
-            relative_path = os.path.relpath(constitution_path, file_path.parent)
-            relative_path = relative_path.replace("\\", "/")
-        except ValueError:
-            relative_path = str(constitution_path).replace("\\", "/")
+        relative_path = _relative_constitution_path(file_path.parent, constitution_path)
 
         if len(agent_types) == 1:
             agent_name = self.get_agent_display_name(agent_types[0])
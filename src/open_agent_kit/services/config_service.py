@@ -40,6 +40,8 @@ Issue Provider Configuration:
 from pathlib import Path
 from typing import Any
 
+import yaml
+
 from open_agent_kit.config.paths import CONFIG_FILE, OAK_DIR
 from open_agent_kit.constants import (
     DEFAULT_CONFIG_YAML,
@@ -48,7 +50,11 @@ from open_agent_kit.constants import (
     VERSION,
 )
 from open_agent_kit.models.config import IssueConfig, OakConfig
-from open_agent_kit.utils import file_exists, read_yaml, write_file
+from open_agent_kit.utils import YAML_SAFE_LOADER, file_exists, write_file
+
+# Parsed configs keyed by config path, stored with the raw file bytes they were
+# parsed from. A load whose bytes match reuses the parse; any edit misses.
+_CONFIG_CACHE: dict[Path, tuple[bytes, OakConfig]] = {}
 
 
 class ConfigService:
@@ -74,21 +80,30 @@ class ConfigService:
 
         If config file doesn't exist, returns default configuration.
         Automatically migrates old 'agent: str' format to 'agents: list[str]'.
+        Unchanged files reuse the previous parse; callers always get their own copy.
         """
-        if not file_exists(self.config_path):
+        try:
+            raw = self.config_path.read_bytes()
+        except OSError:
             return OakConfig()
 
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is not None and cached[0] == raw:
+            return cached[1].model_copy(deep=True)
+
         try:
-            # Load raw data to check for migration
-            data = read_yaml(self.config_path)
+            # Parse the bytes already read once; the model handles migration
+            data = yaml.load(raw, Loader=YAML_SAFE_LOADER) or {}
             needs_migration = "agent" in data and "agents" not in data
-
-            # Load via model (handles migration)
-            config = OakConfig.load(self.config_path)
+            config = OakConfig.from_dict(data, self.config_path) if data else OakConfig()
 
             # Auto-save migrated config
             if auto_migrate and needs_migration:
                 self.save_config(config)
+            elif "features" in data:
+                # Configs without features are inferred from installed commands, which
+                # can change without the file changing, so only cache complete ones
+                _CONFIG_CACHE[self.config_path] = (raw, config.model_copy(deep=True))
 
             return config
         except Exception:
@@ -101,6 +116,7 @@ class ConfigService:
         Args:
             config: OakConfig object to save
         """
+        _CONFIG_CACHE.pop(self.config_path, None)
         config.save(self.config_path)
 
     def create_default_config(
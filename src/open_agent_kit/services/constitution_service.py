@@ -43,6 +43,7 @@ Example:
     ... )
 """
 
+import copy
 import re
 from datetime import date
 from pathlib import Path
@@ -67,6 +68,10 @@ from open_agent_kit.services.template_service import TemplateService
 from open_agent_kit.utils import ensure_dir, file_exists, read_file, write_file
 from open_agent_kit.utils.version import increment_version
 
+# Parsed constitutions keyed by file path, stored with the text they were parsed
+# from. A load whose text matches reuses the parse; any edit misses.
+_CONSTITUTION_CACHE: dict[Path, tuple[str, ConstitutionDocument]] = {}
+
 
 class ConstitutionService:
     """Service for managing constitution documents."""
@@ -146,7 +151,13 @@ class ConstitutionService:
             raise FileNotFoundError(f"Constitution not found at {constitution_path}")
 
         content = read_file(constitution_path)
-        return self._parse_constitution(content, constitution_path)
+        cached = _CONSTITUTION_CACHE.get(constitution_path)
+        if cached is not None and cached[0] == content:
+            return copy.deepcopy(cached[1])
+
+        constitution = self._parse_constitution(content, constitution_path)
+        _CONSTITUTION_CACHE[constitution_path] = (content, copy.deepcopy(constitution))
+        return constitution
 
     def create(
         self,
@@ -530,6 +541,7 @@ class ConstitutionService:
         """
         # Ensure directory exists
         constitution_path = self.get_constitution_path()
+        _CONSTITUTION_CACHE.pop(constitution_path, None)
         ensure_dir(constitution_path.parent)
 
         # Write constitution
@@ -11,6 +11,11 @@ from open_agent_kit.config.paths import FEATURES_DIR
 from open_agent_kit.constants import SUPPORTED_FEATURES
 from open_agent_kit.utils import file_exists, write_file
 
+# Jinja2 environments for the read-only package template directories, keyed by
+# search path and shared so compiled templates survive across TemplateService
+# instances. Custom template directories always get a fresh environment.
+_ENVIRONMENT_CACHE: dict[tuple[str, ...], Environment] = {}
+
 
 class TemplateService:
     """Service for managing and rendering templates."""
@@ -39,7 +44,7 @@ class TemplateService:
         self.env = self._create_environment()
 
     def _create_environment(self) -> Environment:
-        """Create Jinja2 environment with custom filters and globals.
+        """Get the Jinja2 environment for this service's template search path.
 
         Returns:
             Configured Jinja2 Environment
@@ -58,6 +63,28 @@ class TemplateService:
             if package_feature_templates.exists():
                 template_dirs.append(str(package_feature_templates))
 
+        # Custom templates can be edited at any time, so never share their environment
+        if self.templates_dir:
+            return self._build_environment(template_dirs)
+
+        cache_key = tuple(template_dirs)
+        env = _ENVIRONMENT_CACHE.get(cache_key)
+        if env is None:
+            env = self._build_environment(template_dirs)
+            _ENVIRONMENT_CACHE[cache_key] = env
+
+        return env
+
+    @staticmethod
+    def _build_environment(template_dirs: list[str]) -> Environment:
+        """Build a Jinja2 environment with custom filters and globals.
+
+        Args:
+            template_dirs: Template search path
+
+        Returns:
+            Configured Jinja2 Environment
+        """
         loader = FileSystemLoader(template_dirs)
         env = Environment(loader=loader, trim_blocks=True, lstrip_blocks=True)
 
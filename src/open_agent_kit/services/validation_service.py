@@ -5,7 +5,6 @@ from datetime import date
 
 from open_agent_kit.config.settings import validation_settings
 from open_agent_kit.constants import (
-    CONSTITUTION_DATE_PATTERN,
     CONSTITUTION_METADATA_PROJECT_NAME,
     CONSTITUTION_NORMATIVE_KEYWORDS,
     CONSTITUTION_NORMATIVE_SECTIONS,
@@ -24,9 +23,31 @@ from open_agent_kit.models.validation import (
     ValidationResult,
 )
 
+# Single alternation over all template tokens so content is scanned once
+TOKEN_PATTERN = re.compile("|".join(re.escape(token) for token in CONSTITUTION_TOKENS))
+
+# Normative keywords match case-insensitively as whole words (MUST, SHALL, MAY, ...)
+NORMATIVE_KEYWORD_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in CONSTITUTION_NORMATIVE_KEYWORDS) + r")\b",
+    re.IGNORECASE,
+)
+
+# Constitution version ("MAJOR.MINOR.PATCH"), with each part captured for comparisons
+VERSION_PARTS_PATTERN = re.compile(CONSTITUTION_VERSION_PATTERN)
+
+# Bullet (- or *) or numbered ("1.", "2)") list item at the start of a line
+LIST_ITEM_PATTERN = re.compile(r"^[^\S\n]*(?:[-*]|\d+[.)][^\S\n]+\S)", re.MULTILINE)
+
+# Negative lookbehind skips false splits on patterns like "1. " or "Fig. "
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<!\d)(?<!\b[A-Z])\.(?:\s+|$)|[!?]+(?:\s+|$)")
+
 
 class ValidationService:
-    """Service for validating constitution documents."""
+    """Service for validating constitution documents.
+
+    The service is stateless: every ``validate()`` call works on its own
+    ValidationResult, so a single instance can be reused.
+    """
 
     def validate(self, constitution: ConstitutionDocument) -> ValidationResult:
         """Validate constitution document.
@@ -39,10 +60,13 @@ class ValidationService:
         """
         result = ValidationResult(is_valid=True)
 
+        # Render once up front so content-wide checks share the same buffer
+        markdown = constitution.to_markdown()
+
         # Run all validation checks
         self._validate_structure(constitution, result)
         self._validate_metadata(constitution, result)
-        self._validate_tokens(constitution, result)
+        self._validate_tokens(constitution, result, markdown)
         self._validate_dates(constitution, result)
         self._validate_language(constitution, result)
         self._validate_versioning(constitution, result)
@@ -66,7 +90,7 @@ class ValidationService:
             result: ValidationResult to update with issues
         """
         # Check for required sections
-        section_titles = [s.title for s in constitution.sections]
+        section_titles = {s.title for s in constitution.sections}
 
         for required_section in CONSTITUTION_REQUIRED_SECTIONS:
             if required_section not in section_titles:
@@ -139,17 +163,19 @@ class ValidationService:
         self,
         constitution: ConstitutionDocument,
         result: ValidationResult,
+        markdown: str,
     ) -> None:
         """Validate that all template tokens are replaced.
 
         Args:
             constitution: Constitution to validate
             result: ValidationResult to update with issues
+            markdown: Rendered markdown of the constitution
         """
-        content = constitution.to_markdown()
+        found_tokens = {match.group() for match in TOKEN_PATTERN.finditer(markdown)}
 
         for token in CONSTITUTION_TOKENS:
-            if token in content:
+            if token in found_tokens:
                 result.add_issue(
                     ValidationIssue(
                         category=ValidationCategory.TOKENS,
@@ -165,7 +191,11 @@ class ValidationService:
         constitution: ConstitutionDocument,
         result: ValidationResult,
     ) -> None:
-        """Validate date formats.
+        """Validate metadata dates.
+
+        Dates are parsed into ``datetime.date`` objects when the constitution is
+        loaded, so their ISO format is already guaranteed; only their values are
+        checked here.
 
         Args:
             constitution: Constitution to validate
@@ -173,35 +203,6 @@ class ValidationService:
         """
         metadata = constitution.metadata
 
-        # Validate ratification date format
-        date_str = metadata.ratification_date.isoformat()
-        if not re.match(CONSTITUTION_DATE_PATTERN, date_str):
-            result.add_issue(
-                ValidationIssue(
-                    category=ValidationCategory.DATES,
-                    priority=ValidationPriority.MEDIUM,
-                    message=f"Invalid ratification date format: {date_str}",
-                    location="Metadata section",
-                    suggested_fix="Use ISO date format (YYYY-MM-DD)",
-                    auto_fixable=True,
-                )
-            )
-
-        # Validate last amendment date if present
-        if metadata.last_amendment:
-            amendment_date_str = metadata.last_amendment.isoformat()
-            if not re.match(CONSTITUTION_DATE_PATTERN, amendment_date_str):
-                result.add_issue(
-                    ValidationIssue(
-                        category=ValidationCategory.DATES,
-                        priority=ValidationPriority.MEDIUM,
-                        message=f"Invalid amendment date format: {amendment_date_str}",
-                        location="Metadata section",
-                        suggested_fix="Use ISO date format (YYYY-MM-DD)",
-                        auto_fixable=True,
-                    )
-                )
-
         # Check for future dates
         today = date.today()
         if metadata.ratification_date > today:
@@ -209,7 +210,7 @@ class ValidationService:
                 ValidationIssue(
                     category=ValidationCategory.DATES,
                     priority=ValidationPriority.LOW,
-                    message=f"Ratification date is in the future: {date_str}",
+                    message=f"Ratification date is in the future: {metadata.ratification_date.isoformat()}",
                     location="Metadata section",
                     suggested_fix=f"Use current date: {today.isoformat()}",
                     auto_fixable=True,
@@ -231,6 +232,7 @@ class ValidationService:
         # Note: We do NOT use re.IGNORECASE here because uppercase keywords
         # like "SHOULD" are valid RFC 2119 language. We only want to flag
         # lowercase informal usage like "should", "could", etc.
+        issues: list[ValidationIssue] = []
         for section in constitution.sections:
             for pattern in NON_DECLARATIVE_PATTERNS:
                 matches = list(re.finditer(pattern, section.content))
@@ -238,7 +240,7 @@ class ValidationService:
                     # Find line number
                     line_num = section.content[: match.start()].count("\n") + 1
 
-                    result.add_issue(
+                    issues.append(
                         ValidationIssue(
                             category=ValidationCategory.LANGUAGE,
                             priority=ValidationPriority.LOW,
@@ -250,6 +252,8 @@ class ValidationService:
                         )
                     )
 
+        result.extend_issues(issues)
+
     def _validate_versioning(
         self,
         constitution: ConstitutionDocument,
@@ -264,7 +268,7 @@ class ValidationService:
         version = constitution.metadata.version
 
         # Check version format
-        if not re.match(CONSTITUTION_VERSION_PATTERN, version):
+        if not VERSION_PARTS_PATTERN.match(version):
             result.add_issue(
                 ValidationIssue(
                     category=ValidationCategory.VERSIONING,
@@ -299,13 +303,15 @@ class ValidationService:
     ) -> None:
         """Assess qualitative aspects of the constitution."""
 
+        issues: list[ValidationIssue] = []
         for section in constitution.sections:
             content = section.content.strip()
 
             if section.required:
-                sentence_count = self._count_substantive_sentences(content)
-                if sentence_count < validation_settings.constitution_min_sentences:
-                    result.add_issue(
+                min_sentences = validation_settings.constitution_min_sentences
+                sentence_count = self._count_substantive_sentences(content, limit=min_sentences)
+                if sentence_count < min_sentences:
+                    issues.append(
                         ValidationIssue(
                             category=ValidationCategory.QUALITY,
                             priority=ValidationPriority.MEDIUM,
@@ -323,9 +329,8 @@ class ValidationService:
                     )
 
             if section.title in CONSTITUTION_NORMATIVE_SECTIONS:
-                upper_content = content.upper()
-                if not any(keyword in upper_content for keyword in CONSTITUTION_NORMATIVE_KEYWORDS):
-                    result.add_issue(
+                if not NORMATIVE_KEYWORD_PATTERN.search(content):
+                    issues.append(
                         ValidationIssue(
                             category=ValidationCategory.QUALITY,
                             priority=ValidationPriority.MEDIUM,
@@ -344,7 +349,7 @@ class ValidationService:
             for pattern in CONSTITUTION_VAGUE_POLICY_PATTERNS:
                 for match in re.finditer(pattern, content, re.IGNORECASE):
                     line_num = content[: match.start()].count("\n") + 1
-                    result.add_issue(
+                    issues.append(
                         ValidationIssue(
                             category=ValidationCategory.QUALITY,
                             priority=ValidationPriority.LOW,
@@ -358,6 +363,8 @@ class ValidationService:
                         )
                     )
 
+        result.extend_issues(issues)
+
     def _check_consistency(
         self,
         constitution: ConstitutionDocument,
@@ -370,8 +377,10 @@ class ValidationService:
             return
 
         # Ensure amendments are chronological
+        chronological = True
         for index in range(1, len(amendments)):
             if amendments[index].date < amendments[index - 1].date:
+                chronological = False
                 result.add_issue(
                     ValidationIssue(
                         category=ValidationCategory.CONSISTENCY,
@@ -406,7 +415,11 @@ class ValidationService:
                 previous_version = current_version
 
         # Validate metadata last amendment alignment
-        latest_amendment_date = max(amendment.date for amendment in amendments)
+        # Sorted amendments end with the latest date; only scan when out of order
+        if chronological:
+            latest_amendment_date = amendments[-1].date
+        else:
+            latest_amendment_date = max(amendment.date for amendment in amendments)
         metadata_last_amendment = constitution.metadata.last_amendment
         if metadata_last_amendment is None:
             result.add_issue(
@@ -436,7 +449,7 @@ class ValidationService:
             )
 
     @staticmethod
-    def _count_substantive_sentences(content: str) -> int:
+    def _count_substantive_sentences(content: str, limit: int | None = None) -> int:
         """Count substantive sentences or bullet/numbered list items in content.
 
         This method counts actionable statements using multiple heuristics:
@@ -446,32 +459,44 @@ class ValidationService:
 
         The sentence regex uses a negative lookbehind to avoid splitting on
         numbered list patterns like "1. " or "2. ".
+
+        Args:
+            content: Section content to analyze
+            limit: Optional count at which to stop scanning early. Callers that only
+                compare against a threshold pass it here to avoid a full scan.
+
+        Returns:
+            Number of substantive statements, capped at ``limit`` when given
         """
         text = content.strip()
         if not text:
             return 0
 
-        lines = text.splitlines()
-
-        # Count bullet points (- or *)
-        bullet_count = sum(1 for line in lines if line.strip().startswith(("-", "*")))
-
-        # Count numbered list items (e.g., "1.", "2)", "10.")
-        numbered_pattern = re.compile(r"^\s*\d+[.)]\s+\S")
-        numbered_count = sum(1 for line in lines if numbered_pattern.match(line))
-
-        list_count = bullet_count + numbered_count
+        # Count bullet points (- or *) and numbered list items (e.g., "1.", "2)", "10.")
+        # with one multiline regex scan rather than a Python-level loop over lines
+        list_count = 0
+        for _ in LIST_ITEM_PATTERN.finditer(text):
+            list_count += 1
+            if limit is not None and list_count >= limit:
+                return list_count
 
         # If we have list items, that's a good count of actionable statements
         if list_count > 0:
             return list_count
 
-        # Fall back to sentence counting, avoiding false splits on numbered lists
-        # Use negative lookbehind to skip patterns like "1. " or "Fig. "
-        sentence_pattern = re.compile(r"(?<!\d)(?<!\b[A-Z])\.(?:\s+|$)|[!?]+(?:\s+|$)")
-        # Split on sentence boundaries and filter empty segments
-        segments = sentence_pattern.split(text)
-        sentence_count = sum(1 for seg in segments if seg and seg.strip())
+        # Fall back to sentence counting, counting non-blank segments between boundaries
+        sentence_count = 0
+        segment_start = 0
+        for match in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+            segment = text[segment_start : match.start()]
+            segment_start = match.end()
+            if segment and not segment.isspace():
+                sentence_count += 1
+                if limit is not None and sentence_count >= limit:
+                    return sentence_count
+        tail = text[segment_start:]
+        if tail and not tail.isspace():
+            sentence_count += 1
 
         return max(sentence_count, 1)  # At least 1 if there's any content
 
@@ -479,17 +504,24 @@ class ValidationService:
     def _parse_version(version: str) -> tuple[int, int, int] | None:
         """Parse semantic version string into tuple."""
 
-        try:
-            major, minor, patch = version.split(".")
-            return int(major), int(minor), int(patch)
-        except (ValueError, AttributeError):
+        match = VERSION_PARTS_PATTERN.fullmatch(version or "")
+        if match is None:
             return None
+        return int(match[1]), int(match[2]), int(match[3])
 
     @classmethod
     def from_config(cls) -> "ValidationService":
-        """Create service instance.
+        """Get the shared service instance.
+
+        The service keeps no state between ``validate()`` calls, so one instance
+        is reused (and is safe to share across threads).
 
         Returns:
             Configured ValidationService
         """
-        return cls()
+        return _default_service
+
+
+# Shared instance returned by ValidationService.from_config(); the class has no
+# __init__ and holds no state, so creating it at import costs nothing
+_default_service = ValidationService()
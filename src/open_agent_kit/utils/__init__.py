@@ -28,6 +28,8 @@ from open_agent_kit.utils.env_utils import (
     update_env_file,
 )
 from open_agent_kit.utils.file_utils import (
+    YAML_SAFE_DUMPER,
+    YAML_SAFE_LOADER,
     cleanup_empty_directories,
     copy_dir,
     copy_file,
@@ -123,6 +125,8 @@ __all__ = [
     "list_dirs",
     "read_yaml",
     "write_yaml",
+    "YAML_SAFE_LOADER",
+    "YAML_SAFE_DUMPER",
     "get_file_size",
     "get_file_modified_time",
     "is_empty_dir",
@@ -1,37 +1,50 @@
 """Rich Console utilities for beautiful CLI output."""
 
+from operator import itemgetter
 from typing import Any
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 from rich.theme import Theme
 
 from open_agent_kit.config.messages import BANNER
 
-# Custom theme for consistent styling
-custom_theme = Theme(
-    {
-        "info": "cyan",
-        "success": "green",
-        "warning": "yellow",
-        "error": "red",
-        "muted": "dim",
-        "primary": "cyan bold",
-        "secondary": "blue",
-    }
-)
-
-# Global console instance
+# Custom theme styles for consistent styling. The Theme itself is built on first
+# use so commands that never print (e.g. --help) skip parsing it.
+THEME_STYLES = {
+    "info": "cyan",
+    "success": "green",
+    "warning": "yellow",
+    "error": "red",
+    "muted": "dim",
+    "primary": "cyan bold",
+    "secondary": "blue",
+}
+
+# Global console instance and its theme
 _console: Console | None = None
+_theme: Theme | None = None
+
+
+def _get_theme() -> Theme:
+    """Build the custom theme on first use and cache it."""
+    global _theme
+    if _theme is None:
+        _theme = Theme(THEME_STYLES)
+    return _theme
+
+
+def __getattr__(name: str) -> Any:
+    """Provide the public ``custom_theme`` attribute without building it at import."""
+    if name == "custom_theme":
+        return _get_theme()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_console() -> Console:
     """Get or create the global console instance."""
     global _console
     if _console is None:
-        _console = Console(theme=custom_theme)
+        _console = Console(theme=_get_theme())
     return _console
 
 
@@ -78,6 +91,8 @@ def print_panel(
     **kwargs: Any,
 ) -> None:
     """Print content in a styled panel."""
+    from rich.panel import Panel
+
     console = get_console()
     panel = Panel(content, title=title, border_style=style, **kwargs)
     console.print(panel)
@@ -97,6 +112,8 @@ def print_table(
         columns: Optional list of column names (uses keys from first dict if not provided)
         **kwargs: Additional arguments passed to Table constructor
     """
+    from rich.table import Table
+
     console = get_console()
 
     if not data:
@@ -116,22 +133,47 @@ def print_table(
         header = col.replace("_", " ").title()
         table.add_column(header, style="cyan")
 
-    # Add rows
-    for row in data:
-        table.add_row(*[str(row.get(col, "")) for col in columns])
+    # Add rows, extracting all columns with one itemgetter call per row and
+    # falling back to per-key lookups only for rows with missing keys
+    if not columns:
+        # itemgetter needs at least one key; keep one empty row per item
+        for _ in data:
+            table.add_row()
+    else:
+        getter = itemgetter(*columns)
+        single_column = len(columns) == 1
+        for row in data:
+            try:
+                values = getter(row)
+            except KeyError:
+                values = tuple(row.get(col, "") for col in columns)
+            else:
+                if single_column:
+                    values = (values,)
+            table.add_row(*map(str, values))
 
     console.print(table)
 
 
-def print_divider(char: str = "─", style: str = "muted") -> None:
-    """Print a horizontal divider."""
+def print_divider(char: str = "─", style: str = "muted", width: int | None = None) -> None:
+    """Print a horizontal divider.
+
+    Args:
+        char: Character used to draw the divider
+        style: Rich style applied to the divider
+        width: Divider width; defaults to the console width. Callers printing many
+            dividers can pass a precomputed width to skip the terminal size lookup.
+    """
     console = get_console()
-    width = console.width
+    if width is None:
+        width = console.width
     console.print(char * width, style=style)
 
 
 def print_step(step_number: int, total_steps: int, message: str) -> None:
     """Print a step indicator."""
+    from rich.text import Text
+
     console = get_console()
     step_text = Text()
     step_text.append(f"[{step_number}/{total_steps}] ", style="cyan bold")
@@ -282,8 +324,8 @@ def print_dict(data: dict[str, Any], indent: int = 0) -> None:
 
 def print_code_block(code: str, language: str = "python") -> None:
     """Print a syntax-highlighted code block."""
-    console = get_console()
     from rich.syntax import Syntax
 
+    console = get_console()
     syntax = Syntax(code, language, theme="monokai", line_numbers=True)
     console.print(syntax)
@@ -6,6 +6,10 @@ from typing import Any
 
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it, else pure Python
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def ensure_dir(path: Path) -> None:
     """Ensure directory exists, creating it if necessary.
@@ -206,7 +210,7 @@ def read_yaml(path: Path) -> dict[str, Any]:
         raise FileNotFoundError(f"YAML file not found: {path}")
 
     with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YAML_SAFE_LOADER)
         return data if data is not None else {}
 
 
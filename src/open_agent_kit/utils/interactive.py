@@ -3,13 +3,28 @@
 from collections.abc import Callable
 
 import readchar
+from rich.console import Console
+from rich.text import Text
 
 from open_agent_kit.utils.console import get_console
 
+# Keys that confirm a selection (readchar reports Enter differently per platform)
+ENTER_KEYS = frozenset({readchar.key.ENTER, readchar.key.CR, readchar.key.LF})
+
+# Responses accepted as "yes" by confirm (compared case-insensitively)
+CONFIRM_YES_RESPONSES = frozenset({"y", "yes"})
+
+# SGR codes for menu frames written straight to the console file
+ANSI_DIM = "2"
+ANSI_CYAN = "36"
+ANSI_BOLD_CYAN = "1;36"
+
 
 class SelectOption:
     """Represents a selectable option."""
 
+    __slots__ = ("value", "label", "description")
+
     def __init__(
         self,
         value: str,
@@ -32,6 +47,89 @@ class SelectOption:
         return f"SelectOption(value={self.value}, label={self.label})"
 
 
+def _clear_lines(console: Console, count: int) -> None:
+    """Move the cursor up ``count`` lines and clear everything below it.
+
+    Emits a single cursor-previous-line escape (CSI n F) plus clear-to-end
+    (CSI J) in one write, rather than one escape per line.
+
+    Args:
+        console: Console whose output file holds the rendered lines
+        count: Number of previously rendered lines to clear
+    """
+    if count <= 0:
+        return
+    console.file.write(f"\033[{count}F\033[J")
+    console.file.flush()
+
+
+def _rewrite_line(console: Console, lines_up: int, line: Text | str) -> None:
+    """Replace one previously rendered line in place.
+
+    Moves up to the line, clears it, prints the new content and moves back down,
+    so the cursor is left below the menu where the full render put it.
+
+    Args:
+        console: Console whose output file holds the rendered lines
+        lines_up: Distance from the line below the menu to the line to rewrite
+        line: New content for the line (without a trailing newline). A string is
+            written as-is in the same write as the cursor escapes.
+    """
+    if isinstance(line, str):
+        console.file.write(f"\033[{lines_up}F\033[2K{line}\033[{lines_up}E")
+    else:
+        console.file.write(f"\033[{lines_up}F\033[2K")
+        console.print(line, end="")
+        console.file.write(f"\033[{lines_up}E")
+    console.file.flush()
+
+
+def _sgr(text: str, code: str, use_color: bool) -> str:
+    """Wrap text in an ANSI SGR style sequence.
+
+    Args:
+        text: Text to style
+        code: SGR parameters (e.g. ``ANSI_DIM``)
+        use_color: Whether the console renders styles; plain text is returned if not
+
+    Returns:
+        Styled (or unchanged) text
+    """
+    if not use_color:
+        return text
+    return f"\033[{code}m{text}\033[0m"
+
+
+def _multi_select_row(label: str, is_selected: bool, is_current: bool) -> Text:
+    """Build the display line for one multi_select option.
+
+    Args:
+        label: Option label
+        is_selected: Whether the option is checked
+        is_current: Whether the option has the cursor
+
+    Returns:
+        Styled line for the option
+    """
+    if is_selected:
+        checkbox = "☑"
+        style = "green"
+    else:
+        checkbox = "☐"
+        style = "dim"
+
+    if is_current:
+        prefix = "❯"
+        if is_selected:
+            style = "green bold"
+        else:
+            style = "cyan bold"
+    else:
+        prefix = " "
+
+    return Text(f"  {prefix} {checkbox} {label}", style=style)
+
+
 def select(
     options: list[SelectOption] | list[str],
     message: str = "Select an option:",
@@ -78,60 +176,46 @@ def select(
     console.print(f"\n[cyan]?[/cyan] {message}")
     console.print("[dim](Use arrow keys to navigate, Enter to select)[/dim]\n")
 
-    first_render = True
-    while True:
-        # Clear previous options (skip on first render)
-        if not first_render:
-            # Count lines to clear: each option + description lines
-            lines_to_clear = 0
-            for opt in normalized_options:
-                lines_to_clear += 1  # Option line
-                if opt.description:
-                    lines_to_clear += 1  # Description line
-
-            # Move cursor up and clear
-            for _ in range(lines_to_clear):
-                console.file.write("\033[F")  # Move up one line
-            console.file.write("\033[J")  # Clear from cursor down
-            console.file.flush()
-
-        first_render = False
-
-        # Print options
-        for i, option in enumerate(normalized_options):
-            if i == current_index:
-                # Highlighted option
-                prefix = "❯"
-                style = "cyan bold"
-                console.print(f"  {prefix} {option.label}", style=style)
-                if option.description:
-                    console.print(f"    [dim]{option.description}[/dim]")
-            else:
-                # Normal option
-                prefix = " "
-                console.print(f"  {prefix} {option.label}", style="dim")
-                if option.description:
-                    console.print(f"    [dim]{option.description}[/dim]")
+    # Options don't change while the menu is open, so build each row's lines,
+    # their line offsets and the menu height once instead of on every keypress
+    option_count = len(normalized_options)
+    active_rows = [f"  ❯ {opt.label}" for opt in normalized_options]
+    inactive_rows = [f"    {opt.label}" for opt in normalized_options]
+    description_rows = [
+        f"    {opt.description}" if opt.description else "" for opt in normalized_options
+    ]
+    row_offsets: list[int] = []
+    total_lines = 0  # Each option line + description lines
+    for description_row in description_rows:
+        row_offsets.append(total_lines)
+        total_lines += 2 if description_row else 1
+
+    # Render the whole menu once; navigation only repaints the rows it changes
+    menu = Text()
+    for i in range(option_count):
+        if i == current_index:
+            # Highlighted option
+            menu.append(active_rows[i], style="cyan bold")
+        else:
+            # Normal option
+            menu.append(inactive_rows[i], style="dim")
+        menu.append("\n")
+        if description_rows[i]:
+            menu.append(f"{description_rows[i]}\n", style="dim")
+    console.print(menu, end="")
 
+    while True:
         # Get key input
         key = readchar.readkey()
 
+        previous_index = current_index
         if key == readchar.key.UP:
-            current_index = (current_index - 1) % len(normalized_options)
+            current_index = (current_index - 1) % option_count
         elif key == readchar.key.DOWN:
-            current_index = (current_index + 1) % len(normalized_options)
-        elif key in [readchar.key.ENTER, readchar.key.CR, readchar.key.LF]:
+            current_index = (current_index + 1) % option_count
+        elif key in ENTER_KEYS:
             # Clear the menu
-            lines_to_clear = 0
-            for opt in normalized_options:
-                lines_to_clear += 1
-                if opt.description:
-                    lines_to_clear += 1
-
-            for _ in range(lines_to_clear):
-                console.file.write("\033[F")
-            console.file.write("\033[J")
-            console.file.flush()
+            _clear_lines(console, total_lines)
 
             # Print final selection
             selected = normalized_options[current_index]
@@ -141,6 +225,18 @@ def select(
             console.print("\n\n[red]Cancelled[/red]")
             raise KeyboardInterrupt()
 
+        if current_index != previous_index:
+            _rewrite_line(
+                console,
+                total_lines - row_offsets[previous_index],
+                Text(inactive_rows[previous_index], style="dim"),
+            )
+            _rewrite_line(
+                console,
+                total_lines - row_offsets[current_index],
+                Text(active_rows[current_index], style="cyan bold"),
+            )
+
 
 def multi_select(
     options: list[SelectOption] | list[str],
@@ -164,7 +260,8 @@ def multi_select(
             "constitution" will also deselect "rfc" and "issues".
 
     Returns:
-        List of selected option values
+        List of selected option values, defaults first (in option order) followed
+        by options in the order they were selected
 
     Example:
         >>> options = ["feature", "bugfix", "docs", "refactor"]
@@ -182,10 +279,14 @@ def multi_select(
     if not normalized_options:
         raise ValueError("No options provided")
 
-    # Track selections
-    selected = set()
+    # Read each option's fields once; the render loop indexes these tuples
+    rows = [(opt.value, opt.label, opt.description) for opt in normalized_options]
+
+    # Track selections as value -> label, in the order they were selected
+    selected: dict[str, str] = {}
     if defaults:
-        selected = {opt.value for opt in normalized_options if opt.value in defaults}
+        default_values = set(defaults)
+        selected = {value: label for value, label, _ in rows if value in default_values}
 
     current_index = 0
 
@@ -195,93 +296,93 @@ def multi_select(
         "[dim](Use arrow keys to navigate, Space to select/deselect, Enter to confirm)[/dim]\n"
     )
 
-    first_render = True
-    prev_had_description = False  # Track if previous render had a description
-    while True:
-        # Clear previous options (skip on first render)
-        if not first_render:
-            # Count lines to clear: options + (description if shown) + count line + blank
-            lines_to_clear = len(normalized_options)
-            if prev_had_description:
-                lines_to_clear += 1  # Add line for description
-            lines_to_clear += 2  # Count line + blank line
-
-            # Move cursor up and clear
-            for _ in range(lines_to_clear):
-                console.file.write("\033[F")  # Move up one line
-            console.file.write("\033[J")  # Clear from cursor down
-            console.file.flush()
+    # Menu height without the focused option's description: options + blank + count line
+    option_count = len(rows)
+    base_lines = option_count + 2
 
-        first_render = False
-
-        # Check if current option has description (for next iteration's clearing)
-        current_option = normalized_options[current_index]
-        prev_had_description = bool(current_option.description)
-
-        # Print options
-        for i, option in enumerate(normalized_options):
-            is_selected = option.value in selected
-            is_current = i == current_index
-
-            if is_selected:
-                checkbox = "☑"
-                style = "green"
-            else:
-                checkbox = "☐"
-                style = "dim"
-
-            if is_current:
-                prefix = "❯"
-                if is_selected:
-                    style = "green bold"
-                else:
-                    style = "cyan bold"
-            else:
-                prefix = " "
-
-            console.print(f"  {prefix} {checkbox} {option.label}", style=style)
-            if option.description and is_current:
-                console.print(f"      [dim]{option.description}[/dim]")
+    rendered_lines = 0  # Lines drawn by the last full render
+    dirty_rows: set[int] | None = None  # Rows to repaint; None redraws the whole menu
+    count_dirty = False
+    while True:
+        has_description = bool(rows[current_index][2])
 
-        # Print selection count
+        # Selection count
         count_text = f"Selected: {len(selected)}"
         if max_selections:
             count_text += f"/{max_selections}"
-        console.print(f"\n[dim]{count_text}[/dim]")
+
+        if dirty_rows is None:
+            # Clear previous options (skip on first render)
+            _clear_lines(console, rendered_lines)
+
+            # Build option lines and the selection count into one Text and print it once
+            menu = Text()
+            for i, (value, label, description) in enumerate(rows):
+                is_current = i == current_index
+                menu.append_text(_multi_select_row(label, value in selected, is_current))
+                menu.append("\n")
+                if description and is_current:
+                    menu.append(f"      {description}\n", style="dim")
+            menu.append(f"\n{count_text}\n", style="dim")
+            console.print(menu, end="")
+            rendered_lines = base_lines + int(has_description)
+        else:
+            # Repaint only the rows that changed; the focused option's description
+            # line sits directly below it and shifts the rows after it down by one
+            for i in dirty_rows:
+                row_offset = i + int(has_description and i > current_index)
+                value, label, _ = rows[i]
+                _rewrite_line(
+                    console,
+                    rendered_lines - row_offset,
+                    _multi_select_row(label, value in selected, i == current_index),
+                )
+            if count_dirty:
+                _rewrite_line(console, 1, Text(count_text, style="dim"))
 
         # Get key input
         key = readchar.readkey()
 
-        if key == readchar.key.UP:
-            current_index = (current_index - 1) % len(normalized_options)
-        elif key == readchar.key.DOWN:
-            current_index = (current_index + 1) % len(normalized_options)
+        dirty_rows = set()
+        count_dirty = False
+        if key in (readchar.key.UP, readchar.key.DOWN):
+            previous_index = current_index
+            step = -1 if key == readchar.key.UP else 1
+            current_index = (current_index + step) % option_count
+            if has_description or rows[current_index][2]:
+                # Description line moves with the cursor, so redraw everything
+                dirty_rows = None
+            else:
+                dirty_rows = {previous_index, current_index}
         elif key == readchar.key.SPACE:
-            option = normalized_options[current_index]
-            if option.value in selected:
+            current_value, current_label, _ = rows[current_index]
+            changed_values = set()
+            if current_value in selected:
                 # Deselecting - also deselect dependents
-                selected.remove(option.value)
-                if dependents_map and option.value in dependents_map:
-                    for dependent in dependents_map[option.value]:
-                        selected.discard(dependent)
+                del selected[current_value]
+                changed_values.add(current_value)
+                if dependents_map and current_value in dependents_map:
+                    for dependent in dependents_map[current_value]:
+                        if dependent in selected:
+                            del selected[dependent]
+                            changed_values.add(dependent)
             else:
                 if max_selections is None or len(selected) < max_selections:
-                    selected.add(option.value)
-        elif key in [readchar.key.ENTER, readchar.key.CR, readchar.key.LF]:
+                    selected[current_value] = current_label
+                    changed_values.add(current_value)
+            if changed_values:
+                dirty_rows = {i for i, (value, _, _) in enumerate(rows) if value in changed_values}
+                count_dirty = True
+        elif key in ENTER_KEYS:
             if len(selected) < min_selections:
                 # Show error but continue
                 continue
 
             # Clear the menu
-            lines_to_clear = len(normalized_options) + 2  # options + count line + blank
-            for _ in range(lines_to_clear):
-                console.file.write("\033[F")
-            console.file.write("\033[J")
-            console.file.flush()
+            _clear_lines(console, rendered_lines)
 
             # Print final selection
-            selected_labels = [opt.label for opt in normalized_options if opt.value in selected]
-            console.print(f"[cyan]?[/cyan] {message} [green]{', '.join(selected_labels)}[/green]")
+            console.print(f"[cyan]?[/cyan] {message} [green]{', '.join(selected.values())}[/green]")
             return list(selected)
         elif key == readchar.key.CTRL_C:
             console.print("\n\n[red]Cancelled[/red]")
@@ -311,7 +412,7 @@ def confirm(message: str, default: bool = False) -> bool:
         response = console.input(prompt_text)
         if not response:
             return default
-        return response.lower() in ("y", "yes")
+        return response.casefold() in CONFIRM_YES_RESPONSES
     except (KeyboardInterrupt, EOFError):
         console.print()
         return False
@@ -411,8 +512,6 @@ def select_with_search(
         >>> options = ["option1", "option2", "option3"]
         >>> result = select_with_search(options, "Choose:")
     """
-    import sys
-
     console = get_console()
 
     # Convert strings to SelectOption objects
@@ -425,14 +524,18 @@ def select_with_search(
     if not select_options:
         raise ValueError("No options provided")
 
+    # Read each option's fields once; filtering and rendering work on these tuples
+    rows = [(opt.value, opt.label, opt.description) for opt in select_options]
+
     search_query = ""
-    filtered_options: list[SelectOption] = select_options[:]
+    # Shares rows rather than copying it; filtered lists are only read, never mutated
+    filtered_options: list[tuple[str, str, str | None]] = rows
     current_index = 0
 
     # Find default index
     if default:
-        for i, opt in enumerate(filtered_options):
-            if opt.value == default:
+        for i, (value, _, _) in enumerate(filtered_options):
+            if value == default:
                 current_index = i
                 break
 
@@ -440,60 +543,73 @@ def select_with_search(
     console.print(f"\n[cyan]?[/cyan] {message}")
     console.print("[dim](Type to search, use arrow keys to navigate, Enter to select)[/dim]\n")
 
+    # Lowercase labels and values once; only the query changes per keystroke
+    search_keys = [(label.lower(), value.lower()) for value, label, _ in rows]
+    filtered_query = search_query  # Query that filtered_options was built for
+
+    # Frames carry only fixed styles, so they are built as ANSI strings and written
+    # directly instead of going through Rich's render pipeline on every keystroke
+    use_color = console.color_system is not None and not console.no_color
+
+    rendered_lines = 0
+    needs_redraw = True  # Only query changes redraw the menu; navigation repaints rows
     while True:
-        # Filter options based on search query
-        if search_query:
-            filtered_options = [
-                opt
-                for opt in select_options
-                if search_query.lower() in opt.label.lower()
-                or search_query.lower() in opt.value.lower()
-            ]
-            if not filtered_options:
-                filtered_options = select_options[:]
-            current_index = min(current_index, len(filtered_options) - 1)
-        else:
-            filtered_options = select_options[:]
-
-        # Clear previous display
-        if current_index > 0 or search_query:
-            lines_to_clear = len(filtered_options) + 2
-            sys.stdout.write(f"\033[{lines_to_clear}A")  # Move cursor up
-            sys.stdout.write("\033[J")  # Clear from cursor down
-            sys.stdout.flush()
-
-        # Print search query
-        if search_query:
-            console.print(f"Search: [cyan]{search_query}[/cyan]")
-        else:
-            console.print("Search: [dim]type to filter...[/dim]")
+        # Filter options based on search query (navigation keys leave it unchanged)
+        if search_query != filtered_query:
+            if search_query:
+                query = search_query.lower()
+                filtered_options = [
+                    row
+                    for row, (label, value) in zip(rows, search_keys, strict=True)
+                    if query in label or query in value
+                ]
+                if not filtered_options:
+                    filtered_options = rows
+                current_index = min(current_index, len(filtered_options) - 1)
+            else:
+                filtered_options = rows
+            filtered_query = search_query
 
-        # Print options
-        for i, option in enumerate(filtered_options[:10]):  # Limit display to 10
-            if i == current_index:
-                console.print(f"  ❯ {option.label}", style="cyan bold")
+        if needs_redraw:
+            # Clear previous display (skip on first render)
+            _clear_lines(console, rendered_lines)
+
+            # Build the search line and visible options into one frame and write it once
+            if search_query:
+                frame = [f"Search: {_sgr(search_query, ANSI_CYAN, use_color)}"]
             else:
-                console.print(f"    {option.label}", style="dim")
+                frame = [f"Search: {_sgr('type to filter...', ANSI_DIM, use_color)}"]
 
-        if len(filtered_options) > 10:
-            console.print(f"\n[dim]... and {len(filtered_options) - 10} more[/dim]")
+            for i, (_, label, _) in enumerate(filtered_options[:10]):  # Limit display to 10
+                if i == current_index:
+                    frame.append(_sgr(f"  ❯ {label}", ANSI_BOLD_CYAN, use_color))
+                else:
+                    frame.append(_sgr(f"    {label}", ANSI_DIM, use_color))
+
+            if len(filtered_options) > 10:
+                frame.append("")
+                frame.append(
+                    _sgr(f"... and {len(filtered_options) - 10} more", ANSI_DIM, use_color)
+                )
+            console.file.write("\n".join(frame) + "\n")
+            console.file.flush()
+            rendered_lines = len(frame)
 
         # Get key input
         key = readchar.readkey()
 
+        previous_index = current_index
+        previous_query = search_query
         if key == readchar.key.UP:
             current_index = max(0, current_index - 1)
         elif key == readchar.key.DOWN:
             current_index = min(len(filtered_options) - 1, current_index + 1)
-        elif key in [readchar.key.ENTER, readchar.key.CR, readchar.key.LF]:
+        elif key in ENTER_KEYS:
             if filtered_options:
-                lines_to_clear = min(len(filtered_options), 10) + 2
-                sys.stdout.write(f"\033[{lines_to_clear}A")
-                sys.stdout.write("\033[J")
-                sys.stdout.flush()
-                selected = filtered_options[current_index]
-                console.print(f"[cyan]?[/cyan] {message} [green]{selected.label}[/green]")
-                return selected.value
+                _clear_lines(console, rendered_lines)
+                value, label, _ = filtered_options[current_index]
+                console.print(f"[cyan]?[/cyan] {message} [green]{label}[/green]")
+                return value
         elif key == readchar.key.BACKSPACE:
             search_query = search_query[:-1]
             current_index = 0
@@ -503,3 +619,20 @@ def select_with_search(
         elif len(key) == 1 and key.isprintable():
             search_query += key
             current_index = 0
+
+        needs_redraw = search_query != previous_query
+        if not needs_redraw and current_index != previous_index:
+            # Same filtered list: repaint the two visible rows whose highlight moved
+            # (the search line sits above the first option)
+            if previous_index < 10:
+                _rewrite_line(
+                    console,
+                    rendered_lines - 1 - previous_index,
+                    _sgr(f"    {filtered_options[previous_index][1]}", ANSI_DIM, use_color),
+                )
+            if current_index < 10:
+                _rewrite_line(
+                    console,
+                    rendered_lines - 1 - current_index,
+                    _sgr(f"  ❯ {filtered_options[current_index][1]}", ANSI_BOLD_CYAN, use_color),
+                )
@@ -1,6 +1,7 @@
 """Input validation utilities for open-agent-kit."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from open_agent_kit.constants import (
@@ -10,6 +11,35 @@ from open_agent_kit.constants import (
 )
 from open_agent_kit.models.enums import RFCStatus
 
+RFC_STATUS_VALUES = frozenset(RFCStatus.values())
+
+# Compiled once at import; these helpers are called per file during RFC scans
+RFC_NUMBER_REGEX = re.compile(RFC_NUMBER_PATTERN)
+RFC_FILENAME_REGEX = re.compile(RFC_FILENAME_PATTERN)
+RFC_PREFIX_PATTERN = re.compile(r"^(?:RFC|rfc)[-_\s]*")
+# Heading line with optional whitespace between the leading hashes ("# # Title")
+RFC_HEADING_PATTERN = re.compile(r"^[^\S\n]*(#(?:[^\S\n]*#)*) (.*?)[^\S\n]*$", re.MULTILINE)
+HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+EMPTY_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(\s*\)")
+FILENAME_FORBIDDEN_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+WHITESPACE_OR_HYPHEN_RUN_PATTERN = re.compile(r"[\s-]+")
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+URL_PATTERN = re.compile(
+    r"^https?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
+    r"localhost|"  # localhost
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # or ip
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+SEMVER_PATTERN = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
+    r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
+    r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
+)
+
 
 def validate_rfc_number(rfc_number: str) -> bool:
     """Validate RFC number format.
@@ -24,8 +54,7 @@ def validate_rfc_number(rfc_number: str) -> bool:
         - 001, 002, 0001 (sequential)
         - 2024-001, 2024-002 (year-based)
     """
-    pattern = re.compile(RFC_NUMBER_PATTERN)
-    return bool(pattern.match(rfc_number))
+    return bool(RFC_NUMBER_REGEX.match(rfc_number))
 
 
 def validate_rfc_filename(filename: str) -> bool:
@@ -39,8 +68,7 @@ def validate_rfc_filename(filename: str) -> bool:
 
     Valid format: RFC-###-Title.md
     """
-    pattern = re.compile(RFC_FILENAME_PATTERN)
-    return bool(pattern.match(filename))
+    return bool(RFC_FILENAME_REGEX.match(filename))
 
 
 def parse_rfc_number(rfc_input: str) -> str | None:
@@ -62,7 +90,7 @@ def parse_rfc_number(rfc_input: str) -> str | None:
     """
     # Remove common prefixes
     rfc_input = rfc_input.strip()
-    rfc_input = re.sub(r"^(?:RFC|rfc)[-_\s]*", "", rfc_input)
+    rfc_input = RFC_PREFIX_PATTERN.sub("", rfc_input)
 
     # Validate
     if validate_rfc_number(rfc_input):
@@ -84,8 +112,7 @@ def parse_rfc_filename(filename: str) -> tuple[str, str] | None:
         >>> parse_rfc_filename("RFC-001-Add-User-Auth.md")
         ("001", "Add-User-Auth")
     """
-    pattern = re.compile(RFC_FILENAME_PATTERN)
-    match = pattern.match(filename)
+    match = RFC_FILENAME_REGEX.match(filename)
 
     if match:
         number = match.group(1)
@@ -104,7 +131,7 @@ def validate_rfc_status(status: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return status.lower() in RFCStatus.values()
+    return status.lower() in RFC_STATUS_VALUES
 
 
 def validate_agent_type(agent: str) -> bool:
@@ -116,11 +143,19 @@ def validate_agent_type(agent: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    return agent.lower() in _available_agents()
+
+
+@lru_cache(maxsize=1)
+def _available_agents() -> frozenset[str]:
+    """Return the packaged agent types, loaded once per process.
+
+    Agent manifests ship with the package, so the set cannot change at
+    runtime. Call ``_available_agents.cache_clear()`` to force a reload.
+    """
     from open_agent_kit.services.agent_service import AgentService
 
-    agent_service = AgentService()
-    available_agents = agent_service.list_available_agents()
-    return agent.lower() in available_agents
+    return frozenset(AgentService().list_available_agents())
 
 
 def validate_file_path(path: str) -> bool:
@@ -165,13 +200,15 @@ def validate_rfc_content(content: str, strict: bool = False) -> tuple[bool, list
     Returns:
         Tuple of (is_valid, list_of_missing_sections)
     """
-    missing_sections = []
-
-    for section in REQUIRED_RFC_SECTIONS:
-        # Check if section heading exists (with some flexibility)
-        section_pattern = section.replace("#", r"\s*#").strip()
-        if not re.search(rf"^{section_pattern}\s*$", content, re.MULTILINE):
-            missing_sections.append(section)
+    # Collect every heading once, normalized to "<hashes> <title>" so the
+    # required sections can be checked by set membership
+    found_headings = {
+        f"{'#' * match.group(1).count('#')} {match.group(2)}"
+        for match in RFC_HEADING_PATTERN.finditer(content)
+    }
+    missing_sections = [
+        section for section in REQUIRED_RFC_SECTIONS if section not in found_headings
+    ]
 
     is_valid = len(missing_sections) == 0 if strict else len(missing_sections) < 3
 
@@ -227,14 +264,13 @@ def validate_markdown_syntax(content: str) -> tuple[bool, list[str]]:
     """
     issues = []
 
-    lines = content.split("\n")
-
-    # Check for consistent header levels
-    header_pattern = re.compile(r"^(#{1,6})\s+(.+)$")
     previous_level = 0
+    code_block_open = False
 
-    for i, line in enumerate(lines, 1):
-        match = header_pattern.match(line)
+    # Single pass over the lines: header levels, trailing whitespace,
+    # empty links, and code fence tracking
+    for i, line in enumerate(content.split("\n"), 1):
+        match = HEADER_PATTERN.match(line)
         if match:
             current_level = len(match.group(1))
 
@@ -246,21 +282,13 @@ def validate_markdown_syntax(content: str) -> tuple[bool, list[str]]:
 
             previous_level = current_level
 
-    # Check for trailing spaces
-    for i, line in enumerate(lines, 1):
         if line.endswith(" ") and line.strip():
             issues.append(f"Line {i}: Trailing whitespace")
 
-    # Check for empty links
-    empty_link_pattern = re.compile(r"\[([^\]]+)\]\(\s*\)")
-    for i, line in enumerate(lines, 1):
-        if empty_link_pattern.search(line):
+        if EMPTY_LINK_PATTERN.search(line):
             issues.append(f"Line {i}: Empty link found")
 
-    # Check for proper code block closure
-    code_block_open = False
-    for _i, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
+        if line.lstrip().startswith("```"):
             code_block_open = not code_block_open
 
     if code_block_open:
@@ -279,13 +307,10 @@ def sanitize_title(title: str) -> str:
         Sanitized title safe for filenames
     """
     # Remove special characters
-    title = re.sub(r'[<>:"/\\|?*]', "", title)
-
-    # Replace spaces with hyphens
-    title = re.sub(r"\s+", "-", title)
+    title = title.translate(FILENAME_FORBIDDEN_CHARS)
 
-    # Remove multiple consecutive hyphens
-    title = re.sub(r"-+", "-", title)
+    # Collapse runs of whitespace and hyphens into a single hyphen
+    title = WHITESPACE_OR_HYPHEN_RUN_PATTERN.sub("-", title)
 
     # Remove leading/trailing hyphens
     title = title.strip("-")
@@ -302,8 +327,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email format, False otherwise
     """
-    pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    return bool(pattern.match(email))
+    return bool(EMAIL_PATTERN.match(email))
 
 
 def validate_url(url: str) -> bool:
@@ -315,16 +339,7 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL format, False otherwise
     """
-    pattern = re.compile(
-        r"^https?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
-        r"localhost|"  # localhost
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # or ip
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
-    return bool(pattern.match(url))
+    return bool(URL_PATTERN.match(url))
 
 
 def validate_version(version: str) -> bool:
@@ -342,10 +357,4 @@ def validate_version(version: str) -> bool:
         >>> validate_version("1.0")
         False
     """
-    pattern = re.compile(
-        r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
-        r"(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
-        r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
-        r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-    )
-    return bool(pattern.match(version))
+    return bool(SEMVER_PATTERN.match(version))
@@ -2,44 +2,257 @@
 
 import os
 import shutil
-import tempfile
-from collections.abc import Iterator
-from pathlib import Path
+import sys
+from collections.abc import Callable
+from pathlib import Path, PurePosixPath
 
 import pytest
+from typer.testing import CliRunner
+
+from open_agent_kit.services.agent_service import AgentService
+
+# RAM-backed directory for temporary test projects on Linux
+TMPFS_DIR = Path("/dev/shm")
+TMPFS_BASETEMP_KEY = pytest.StashKey[Path]()
+# Subdirectory used under PYTEST_BASETEMP; pytest clears the base temp dir on startup
+ENV_BASETEMP_SUBDIR = "pytest-oak"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put ``tmp_path`` directories on tmpfs when available and not overridden.
+
+    ``--basetemp`` takes precedence, then the ``PYTEST_BASETEMP`` environment variable
+    (for example, to keep temp files on disk in CI). Tests run in a dedicated
+    ``pytest-oak`` subdirectory of ``PYTEST_BASETEMP``, because pytest wipes its base
+    temp directory at startup. Skipped for xdist workers, which inherit the
+    controller's base temp directory.
+    """
+    if config.option.basetemp is not None or hasattr(config, "workerinput"):
+        return
+    env_basetemp = os.environ.get("PYTEST_BASETEMP")
+    if env_basetemp:
+        env_dir = Path(env_basetemp)
+        env_dir.mkdir(parents=True, exist_ok=True)
+        config.option.basetemp = env_dir / ENV_BASETEMP_SUBDIR
+        return
+    if sys.platform != "linux" or not os.access(TMPFS_DIR, os.W_OK | os.X_OK):
+        return
+    basetemp = TMPFS_DIR / f"pytest-oak-{os.getpid()}"
+    config.option.basetemp = basetemp
+    config.stash[TMPFS_BASETEMP_KEY] = basetemp
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Remove the tmpfs base temp directory after a passing run to free its memory.
+
+    Failed runs keep it so the failing tests' files can be inspected.
+    """
+    basetemp = session.config.stash.get(TMPFS_BASETEMP_KEY, None)
+    if basetemp is not None and exitstatus == pytest.ExitCode.OK:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """Create a CLI test runner shared across the session.
+
+    CliRunner keeps no state between invoke calls, so one instance serves every test.
+    """
+    return CliRunner()
 
 
 @pytest.fixture
-def temp_project_dir() -> Iterator[Path]:
+def temp_project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Create a temporary project directory for testing.
 
-    Yields:
-        Path to temporary directory
+    The working directory is switched to the project for the duration of the test.
+    This is safe under pytest-xdist because each worker is a separate process with
+    its own working directory.
+
+    Returns:
+        Path to temporary directory, already resolved by pytest's ``tmp_path``
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def empty_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create an empty project directory shared across the test session.
+
+    For tests that only read from the project root (path resolution, detection
+    in an empty project). Tests that write files must use ``temp_project_dir``.
+
+    Returns:
+        Path to empty directory
+    """
+    return tmp_path_factory.mktemp("empty_project")
+
+
+def _init_template(tmp_path_factory: pytest.TempPathFactory, name: str, agents: list[str]) -> Path:
+    """Run ``oak init`` with the given agents into a fresh session directory."""
+    from open_agent_kit.commands.init_cmd import init_command
+
+    template_dir = tmp_path_factory.mktemp(name)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(template_dir)
+        init_command(force=False, agent=agents, no_interactive=True)
+    return template_dir
+
+
+@pytest.fixture(scope="session")
+def initialized_project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run ``oak init`` once per session into a template project directory.
+
+    Returns:
+        Path to the initialized template (copy it; do not modify in place)
+    """
+    return _init_template(tmp_path_factory, "initialized_project", [])
+
+
+@pytest.fixture(scope="session")
+def initialized_project_with_agent_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run ``oak init --agent claude`` once per session into a template project directory.
+
+    Returns:
+        Path to the initialized template (copy it; do not modify in place)
     """
-    temp_dir = Path(tempfile.mkdtemp(prefix="open-agent-kit-test-"))
-    original_cwd = Path.cwd()
-    try:
-        os.chdir(temp_dir)
-        yield temp_dir
-    finally:
-        os.chdir(original_cwd)
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    return _init_template(tmp_path_factory, "initialized_project_with_agent", ["claude"])
+
+
+def _copy_template(template_dir: Path, project_dir: Path) -> Path:
+    """Copy a session template into a per-test project directory."""
+    shutil.copytree(
+        template_dir,
+        project_dir,
+        copy_function=shutil.copyfile,
+        dirs_exist_ok=True,
+    )
+    return project_dir
 
 
 @pytest.fixture
-def initialized_project(temp_project_dir: Path) -> Path:
+def initialized_project(temp_project_dir: Path, initialized_project_template: Path) -> Path:
     """Create a temporary project with .oak initialized.
 
+    Copies the session's initialized template rather than re-running init per test.
+    Files are copied, not hardlinked: writes such as ``save_config`` truncate in
+    place and would otherwise leak into the shared template.
+
     Args:
         temp_project_dir: Temporary project directory
+        initialized_project_template: Session-wide initialized project to copy
 
     Returns:
         Path to initialized project
     """
-    from open_agent_kit.commands.init_cmd import init_command
+    return _copy_template(initialized_project_template, temp_project_dir)
+
+
+@pytest.fixture
+def initialized_project_with_agent(
+    temp_project_dir: Path, initialized_project_with_agent_template: Path
+) -> Path:
+    """Create a temporary project with .oak initialized and claude agent.
+
+    Copies the session's claude template, like ``initialized_project``.
+
+    Args:
+        temp_project_dir: Temporary project directory
+        initialized_project_with_agent_template: Session-wide claude project to copy
+
+    Returns:
+        Path to initialized project with agent
+    """
+    return _copy_template(initialized_project_with_agent_template, temp_project_dir)
+
+
+@pytest.fixture
+def agent_service(initialized_project: Path) -> AgentService:
+    """Create an AgentService for the initialized temporary project.
+
+    Args:
+        initialized_project: Initialized temporary project directory
+
+    Returns:
+        AgentService rooted at the project
+    """
+    return AgentService(initialized_project)
+
+
+@pytest.fixture
+def seed_project(temp_project_dir: Path) -> Callable[[dict[str, str]], None]:
+    """Provide a helper that writes a tree of files into the temporary project.
+
+    Parent directories are collected across the whole tree and created once each,
+    shallowest first, before the files are written.
+
+    Args:
+        temp_project_dir: Temporary project directory
+
+    Returns:
+        Callable taking a mapping of POSIX relative path to UTF-8 file content
+    """
+
+    def seed(tree: dict[str, str]) -> None:
+        parents = {parent for rel_path in tree for parent in PurePosixPath(rel_path).parents}
+        parents.discard(PurePosixPath("."))
+        for parent in sorted(parents, key=lambda path: len(path.parts)):
+            (temp_project_dir / parent).mkdir(exist_ok=True)
+        for rel_path, content in tree.items():
+            (temp_project_dir / rel_path).write_bytes(content.encode("utf-8"))
+
+    return seed
+
+
+@pytest.fixture(scope="session")
+def default_config_bytes(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[tuple[str, ...]], bytes]:
+    """Render ``create_default_config`` output once per agent list for the session.
+
+    Returns:
+        Callable mapping an agent tuple to the config file bytes it produces
+    """
+    from open_agent_kit.config.paths import CONFIG_FILE
+    from open_agent_kit.services.config_service import ConfigService
+
+    rendered: dict[tuple[str, ...], bytes] = {}
+
+    def render(agents: tuple[str, ...]) -> bytes:
+        if agents not in rendered:
+            project = tmp_path_factory.mktemp("default_config")
+            ConfigService(project).create_default_config(agents=list(agents))
+            rendered[agents] = (project / CONFIG_FILE).read_bytes()
+        return rendered[agents]
+
+    return render
+
+
+@pytest.fixture
+def seed_config(
+    seed_project: Callable[[dict[str, str]], None],
+    default_config_bytes: Callable[[tuple[str, ...]], bytes],
+) -> Callable[[list[str]], None]:
+    """Provide a helper that writes a default config for the given agents.
+
+    Equivalent to ``ConfigService(project).create_default_config(agents=...)`` but
+    writes content rendered once per session, through ``seed_project``, instead of
+    re-running the service.
+
+    Args:
+        seed_project: Helper that writes files into the temporary project
+        default_config_bytes: Session cache of rendered default configs
+
+    Returns:
+        Callable taking the list of configured agent types
+    """
+    from open_agent_kit.config.paths import CONFIG_FILE
+
+    def seed(agents: list[str]) -> None:
+        seed_project({CONFIG_FILE: default_config_bytes(tuple(agents)).decode("utf-8")})
 
-    init_command(force=False, agent=[], no_interactive=True)
-    return temp_project_dir
+    return seed
 
 
 @pytest.fixture
@@ -1,5 +1,7 @@
 """Tests for agent file service."""
 
+import copy
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
 
@@ -14,12 +16,26 @@ from open_agent_kit.models.constitution import (
     ConstitutionStatus,
 )
 from open_agent_kit.services.agent_file_service import AgentFileService
-from open_agent_kit.utils import write_file
+from open_agent_kit.utils import YAML_SAFE_DUMPER
 
+SeedProject = Callable[[dict[str, str]], None]
 
-@pytest.fixture
+# Config files written by the tests (treat as read-only), serialized once at import
+CLAUDE_CONFIG = {"agents": ["claude"], "version": "0.1.0"}
+CLAUDE_COPILOT_CONFIG = {"agents": ["claude", "copilot"], "version": "0.1.0"}
+CLAUDE_CONFIG_YAML = yaml.dump(CLAUDE_CONFIG, Dumper=YAML_SAFE_DUMPER)
+CLAUDE_COPILOT_CONFIG_YAML = yaml.dump(CLAUDE_COPILOT_CONFIG, Dumper=YAML_SAFE_DUMPER)
+
+# Where AgentFileService looks for the config, relative to the project root
+AGENT_FILE_CONFIG_PATH = f"{OAK_DIR}/{CONFIG_FILE}"
+
+
+@pytest.fixture(scope="module")
 def sample_constitution() -> ConstitutionDocument:
-    """Create a sample constitution for testing."""
+    """Create a sample constitution shared by the tests in this module.
+
+    Treat as read-only; tests that modify the constitution use ``mutable_constitution``.
+    """
     metadata = ConstitutionMetadata(
         project_name="Test Project",
         version="1.0.0",
@@ -32,68 +48,79 @@ def sample_constitution() -> ConstitutionDocument:
     return ConstitutionDocument(metadata=metadata, sections=sections)
 
 
-def test_detect_installed_agents_from_config(temp_project_dir: Path) -> None:
-    """Test detecting agents from config file."""
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude", "copilot"], "version": "0.1.0"}
-    config_path = oak_dir / CONFIG_FILE
-    write_file(config_path, yaml.dump(config))
-    service = AgentFileService(temp_project_dir)
-    agents = service.detect_installed_agents()
-    assert "claude" in agents
-    assert "copilot" in agents
+@pytest.fixture(scope="module")
+def empty_service(empty_project_dir: Path) -> AgentFileService:
+    """Create an agent file service for the shared empty project directory."""
+    return AgentFileService(empty_project_dir)
 
 
-def test_detect_installed_agents_from_directories(temp_project_dir: Path) -> None:
-    """Test detecting agents from directory structure."""
-    (temp_project_dir / ".claude").mkdir()
-    (temp_project_dir / ".github").mkdir()
-    service = AgentFileService(temp_project_dir)
-    agents = service.detect_installed_agents()
-    assert "claude" in agents
-    assert "copilot" in agents
+@pytest.fixture(scope="module")
+def claude_agent_file_content(
+    tmp_path_factory: pytest.TempPathFactory, sample_constitution: ConstitutionDocument
+) -> bytes:
+    """Render the Claude agent file for the sample constitution once per module.
 
+    Returned as raw UTF-8 bytes; tests encode their needles instead of decoding the file.
+    """
+    service = AgentFileService(tmp_path_factory.mktemp("claude_agent_file"))
+    generated = service.generate_agent_files(sample_constitution, ["claude"])
+    return generated["claude"].read_bytes()
 
-def test_detect_installed_agents_empty_project(temp_project_dir: Path) -> None:
-    """Test detecting agents in empty project."""
+
+@pytest.fixture
+def mutable_constitution(sample_constitution: ConstitutionDocument) -> ConstitutionDocument:
+    """Create a per-test copy of the sample constitution that may be modified."""
+    return copy.deepcopy(sample_constitution)
+
+
+@pytest.mark.fs
+@pytest.mark.parametrize(
+    ("config_yaml", "agent_dirs", "expected"),
+    [
+        (CLAUDE_COPILOT_CONFIG_YAML, (), ["claude", "copilot"]),
+        (None, (".claude", ".github"), ["claude", "copilot"]),
+        (CLAUDE_CONFIG_YAML, (".claude",), ["claude"]),
+    ],
+    ids=["from_config", "from_directories", "removes_duplicates"],
+)
+def test_detect_installed_agents(
+    temp_project_dir: Path,
+    seed_project: SeedProject,
+    config_yaml: str | None,
+    agent_dirs: tuple[str, ...],
+    expected: list[str],
+) -> None:
+    """Test detecting agents from the config file and agent directories, without duplicates."""
+    if config_yaml is not None:
+        seed_project({AGENT_FILE_CONFIG_PATH: config_yaml})
+    for agent_dir in agent_dirs:
+        (temp_project_dir / agent_dir).mkdir()
     service = AgentFileService(temp_project_dir)
-    agents = service.detect_installed_agents()
-    assert len(agents) == 0
+    assert sorted(service.detect_installed_agents()) == expected
 
 
-def test_detect_installed_agents_removes_duplicates(temp_project_dir: Path) -> None:
-    """Test that duplicate agents are removed."""
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
-    (temp_project_dir / ".claude").mkdir()
-    service = AgentFileService(temp_project_dir)
-    agents = service.detect_installed_agents()
-    assert agents.count("claude") == 1
+def test_detect_installed_agents_empty_project(empty_service: AgentFileService) -> None:
+    """Test detecting agents in empty project."""
+    agents = empty_service.detect_installed_agents()
+    assert len(agents) == 0
 
 
-def test_list_agent_files_no_files(temp_project_dir: Path) -> None:
+@pytest.mark.fs
+def test_list_agent_files_no_files(temp_project_dir: Path, seed_project: SeedProject) -> None:
     """Test listing agent files when none exist."""
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
+    seed_project({AGENT_FILE_CONFIG_PATH: CLAUDE_CONFIG_YAML})
     service = AgentFileService(temp_project_dir)
     agent_files = service.list_agent_files()
     assert "claude" in agent_files
     assert agent_files["claude"] is None
 
 
+@pytest.mark.fs
 def test_list_agent_files_with_existing_files(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+    temp_project_dir: Path, seed_project: SeedProject, sample_constitution: ConstitutionDocument
 ) -> None:
     """Test listing agent files when they exist."""
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
+    seed_project({AGENT_FILE_CONFIG_PATH: CLAUDE_CONFIG_YAML})
     service = AgentFileService(temp_project_dir)
     service.generate_agent_files(sample_constitution, ["claude"])
     agent_files = service.list_agent_files()
@@ -102,77 +129,33 @@ def test_list_agent_files_with_existing_files(
     assert agent_files["claude"].exists()
 
 
-def test_generate_agent_files_for_claude(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
-) -> None:
-    """Test generating agent file for Claude."""
-    service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["claude"])
-    assert "claude" in generated
-    assert generated["claude"].exists()
-    expected_path = temp_project_dir / "CLAUDE.md"
-    assert generated["claude"] == expected_path
-    content = generated["claude"].read_text(encoding="utf-8")
-    assert "Test Project" in content
-    assert "1.0.0" in content
-    assert "oak/constitution.md" in content
-
-
-def test_generate_agent_files_for_copilot(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
-) -> None:
-    """Test generating agent file for GitHub Copilot."""
-    service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["copilot"])
-    assert "copilot" in generated
-    expected_path = temp_project_dir / ".github" / "copilot-instructions.md"
-    assert generated["copilot"] == expected_path
-
-
-def test_generate_agent_files_for_cursor(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
-) -> None:
-    """Test generating agent file for Cursor."""
-    service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["cursor"])
-    assert "cursor" in generated
-    expected_path = temp_project_dir / "AGENTS.md"
-    assert generated["cursor"] == expected_path
-
-
-def test_generate_agent_files_for_codex(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
-) -> None:
-    """Test generating agent file for Codex."""
-    service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["codex"])
-    assert "codex" in generated
-    expected_path = temp_project_dir / "AGENTS.md"
-    assert generated["codex"] == expected_path
-
-
-def test_generate_agent_files_for_gemini(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
-) -> None:
-    """Test generating agent file for Gemini."""
-    service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["gemini"])
-    assert "gemini" in generated
-    expected_path = temp_project_dir / "GEMINI.md"
-    assert generated["gemini"] == expected_path
-
-
-def test_generate_agent_files_for_windsurf(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+@pytest.mark.fs
+@pytest.mark.parametrize(
+    ("agent", "relative_path"),
+    [
+        ("claude", "CLAUDE.md"),
+        ("copilot", ".github/copilot-instructions.md"),
+        ("cursor", "AGENTS.md"),
+        ("codex", "AGENTS.md"),
+        ("gemini", "GEMINI.md"),
+        ("windsurf", ".windsurf/rules/rules.md"),
+    ],
+)
+def test_generate_agent_files_for_agent(
+    temp_project_dir: Path,
+    sample_constitution: ConstitutionDocument,
+    agent: str,
+    relative_path: str,
 ) -> None:
-    """Test generating agent file for Windsurf."""
+    """Test generating the agent file at each agent's expected path."""
     service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["windsurf"])
-    assert "windsurf" in generated
-    expected_path = temp_project_dir / ".windsurf" / "rules" / "rules.md"
-    assert generated["windsurf"] == expected_path
+    generated = service.generate_agent_files(sample_constitution, [agent])
+    assert agent in generated
+    assert generated[agent] == temp_project_dir / relative_path
+    assert generated[agent].exists()
 
 
+@pytest.mark.fs
 def test_generate_agent_files_multiple_agents(
     temp_project_dir: Path, sample_constitution: ConstitutionDocument
 ) -> None:
@@ -186,20 +169,19 @@ def test_generate_agent_files_multiple_agents(
     assert all(path.exists() for path in generated.values())
 
 
+@pytest.mark.fs
 def test_generate_agent_files_auto_detect(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+    temp_project_dir: Path, seed_project: SeedProject, sample_constitution: ConstitutionDocument
 ) -> None:
     """Test generating files for auto-detected agents."""
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude", "copilot"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
+    seed_project({AGENT_FILE_CONFIG_PATH: CLAUDE_COPILOT_CONFIG_YAML})
     service = AgentFileService(temp_project_dir)
     generated = service.generate_agent_files(sample_constitution)
     assert "claude" in generated
     assert "copilot" in generated
 
 
+@pytest.mark.fs
 def test_generate_agent_files_creates_directories(
     temp_project_dir: Path, sample_constitution: ConstitutionDocument
 ) -> None:
@@ -215,33 +197,32 @@ def test_generate_agent_files_creates_directories(
     assert generated_claude["claude"] == temp_project_dir / "CLAUDE.md"
 
 
+@pytest.mark.fs
 def test_update_agent_files(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+    temp_project_dir: Path, seed_project: SeedProject, mutable_constitution: ConstitutionDocument
 ) -> None:
     """Test updating existing agent files."""
     # Set up config with agents
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
+    seed_project({AGENT_FILE_CONFIG_PATH: CLAUDE_CONFIG_YAML})
+
+    # Seed a stale instruction file directly rather than rendering the old version
+    (temp_project_dir / "CLAUDE.md").write_bytes(b"stale instructions")
 
     service = AgentFileService(temp_project_dir)
-    service.generate_agent_files(sample_constitution, ["claude"])
-    sample_constitution.metadata.version = "1.1.0"
-    updated = service.update_agent_files(sample_constitution)
+    mutable_constitution.metadata.version = "1.1.0"
+    updated = service.update_agent_files(mutable_constitution)
     assert "claude" in updated
-    content = updated["claude"].read_text(encoding="utf-8")
-    assert "1.1.0" in content
+    content = updated["claude"].read_bytes()
+    assert b"stale instructions" not in content
+    assert b"1.1.0" in content
 
 
+@pytest.mark.fs
 def test_update_agent_files_only_existing(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+    temp_project_dir: Path, seed_project: SeedProject, sample_constitution: ConstitutionDocument
 ) -> None:
     """Test that update only updates existing agent files."""
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude", "copilot"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
+    seed_project({AGENT_FILE_CONFIG_PATH: CLAUDE_COPILOT_CONFIG_YAML})
     service = AgentFileService(temp_project_dir)
     service.generate_agent_files(sample_constitution, ["claude"])
     updated = service.update_agent_files(sample_constitution)
@@ -249,6 +230,7 @@ def test_update_agent_files_only_existing(
     assert "copilot" not in updated
 
 
+@pytest.mark.fs
 def test_generate_agent_file_invalid_agent(
     temp_project_dir: Path, sample_constitution: ConstitutionDocument
 ) -> None:
@@ -258,19 +240,25 @@ def test_generate_agent_file_invalid_agent(
     assert len(generated) == 0
 
 
+@pytest.mark.fs
 def test_agent_file_content_includes_project_info(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+    claude_agent_file_content: bytes, sample_constitution: ConstitutionDocument
 ) -> None:
     """Test that generated agent files include project information."""
-    service = AgentFileService(temp_project_dir)
-    generated = service.generate_agent_files(sample_constitution, ["claude"])
-    content = generated["claude"].read_text(encoding="utf-8")
-    assert sample_constitution.metadata.project_name in content
-    assert sample_constitution.metadata.version in content
-    if sample_constitution.metadata.tech_stack:
-        assert sample_constitution.metadata.tech_stack in content
+    metadata = sample_constitution.metadata
+    assert metadata.project_name.encode("utf-8") in claude_agent_file_content
+    assert metadata.version.encode("utf-8") in claude_agent_file_content
+    if metadata.tech_stack:
+        assert metadata.tech_stack.encode("utf-8") in claude_agent_file_content
+
+
+@pytest.mark.fs
+def test_agent_file_content_links_constitution(claude_agent_file_content: bytes) -> None:
+    """Test that generated agent files point at the project constitution."""
+    assert b"oak/constitution.md" in claude_agent_file_content
 
 
+@pytest.mark.fs
 def test_agent_file_content_minimal_when_missing_optional_fields(temp_project_dir: Path) -> None:
     """Test that agent files handle missing optional fields."""
     metadata = ConstitutionMetadata(
@@ -285,57 +273,51 @@ def test_agent_file_content_minimal_when_missing_optional_fields(temp_project_di
     generated = service.generate_agent_files(constitution, ["claude"])
     assert "claude" in generated
     assert generated["claude"].exists()
-    content = generated["claude"].read_text(encoding="utf-8")
-    assert "N/A" in content
+    assert b"N/A" in generated["claude"].read_bytes()
 
 
-def test_from_config(temp_project_dir: Path) -> None:
+def test_from_config(empty_project_dir: Path) -> None:
     """Test creating service from configuration."""
-    service = AgentFileService.from_config(temp_project_dir)
+    service = AgentFileService.from_config(empty_project_dir)
     assert isinstance(service, AgentFileService)
-    assert service.project_root == temp_project_dir
-
-
-def test_get_agent_file_path_claude(temp_project_dir: Path) -> None:
-    """Test getting file path for Claude."""
-    service = AgentFileService(temp_project_dir)
-    path = service._get_agent_file_path("claude")
-    assert path == temp_project_dir / "CLAUDE.md"
-
-
-def test_get_agent_file_path_copilot(temp_project_dir: Path) -> None:
-    """Test getting file path for GitHub Copilot."""
-    service = AgentFileService(temp_project_dir)
-    path = service._get_agent_file_path("copilot")
-    assert path == temp_project_dir / ".github" / "copilot-instructions.md"
+    assert service.project_root == empty_project_dir
+
+
+@pytest.mark.parametrize(
+    ("agent", "relative_path"),
+    [
+        ("claude", "CLAUDE.md"),
+        ("copilot", ".github/copilot-instructions.md"),
+        ("cursor", "AGENTS.md"),
+        ("codex", "AGENTS.md"),
+        ("invalid_agent", None),
+    ],
+)
+def test_get_agent_file_path(
+    empty_project_dir: Path,
+    empty_service: AgentFileService,
+    agent: str,
+    relative_path: str | None,
+) -> None:
+    """Test resolving each agent's file path (None for unknown agents)."""
+    expected = empty_project_dir / relative_path if relative_path else None
+    assert empty_service._get_agent_file_path(agent) == expected
 
 
-def test_get_agent_file_path_cursor_and_codex_shared(temp_project_dir: Path) -> None:
+def test_get_agent_file_path_cursor_and_codex_shared(empty_service: AgentFileService) -> None:
     """Test that Cursor and Codex share the same file path."""
-    service = AgentFileService(temp_project_dir)
-    cursor_path = service._get_agent_file_path("cursor")
-    codex_path = service._get_agent_file_path("codex")
-    assert cursor_path == temp_project_dir / "AGENTS.md"
-    assert codex_path == temp_project_dir / "AGENTS.md"
-    assert cursor_path == codex_path
-
-
-def test_get_agent_file_path_invalid_agent(temp_project_dir: Path) -> None:
-    """Test getting file path for invalid agent returns None."""
-    service = AgentFileService(temp_project_dir)
-    path = service._get_agent_file_path("invalid_agent")
-    assert path is None
+    cursor_path = empty_service._get_agent_file_path("cursor")
+    assert cursor_path is not None
+    assert cursor_path == empty_service._get_agent_file_path("codex")
 
 
+@pytest.mark.fs
 def test_agent_files_persist_across_service_instances(
-    temp_project_dir: Path, sample_constitution: ConstitutionDocument
+    temp_project_dir: Path, seed_project: SeedProject, sample_constitution: ConstitutionDocument
 ) -> None:
     """Test that generated agent files persist across service instances."""
     # Set up config with agents
-    oak_dir = temp_project_dir / OAK_DIR
-    oak_dir.mkdir(exist_ok=True)
-    config = {"agents": ["claude"], "version": "0.1.0"}
-    write_file(oak_dir / CONFIG_FILE, yaml.dump(config))
+    seed_project({AGENT_FILE_CONFIG_PATH: CLAUDE_CONFIG_YAML})
 
     service1 = AgentFileService(temp_project_dir)
     generated1 = service1.generate_agent_files(sample_constitution, ["claude"])
@@ -345,6 +327,7 @@ def test_agent_files_persist_across_service_instances(
     assert agent_files["claude"] == generated1["claude"]
 
 
+@pytest.mark.fs
 def test_generate_agent_files_handles_none_agent_gracefully(
     temp_project_dir: Path, sample_constitution: ConstitutionDocument
 ) -> None:
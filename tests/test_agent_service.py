@@ -1,81 +1,93 @@
 """Tests for AgentService - agent instruction file management."""
 
+from collections.abc import Callable
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from open_agent_kit.services.agent_service import AgentService
+from open_agent_kit.models.config import AgentCapabilitiesConfig
+from open_agent_kit.services.agent_service import (
+    CONSTITUTION_REFERENCE_KEYWORD,
+    CONSTITUTION_REFERENCE_MARKERS,
+    AgentService,
+    _relative_constitution_path,
+)
 from open_agent_kit.services.config_service import ConfigService
 
+SeedProject = Callable[[dict[str, str]], None]
+SeedConfig = Callable[[list[str]], None]
 
-class TestGetAgentInstructionFile:
-    """Tests for get_agent_instruction_file method."""
-
-    def test_returns_correct_path_for_claude(self, initialized_project: Path) -> None:
-        """Test get_agent_instruction_file returns correct path for Claude."""
-        service = AgentService(initialized_project)
-        path = service.get_agent_instruction_file("claude")
-        assert path == initialized_project / "CLAUDE.md"
+# Minimal constitution body written by the tests
+CONSTITUTION_CONTENT = "# Constitution\n"
 
-    def test_returns_correct_path_for_copilot(self, initialized_project: Path) -> None:
-        """Test get_agent_instruction_file returns correct path for Copilot."""
-        service = AgentService(initialized_project)
-        path = service.get_agent_instruction_file("copilot")
-        assert path == initialized_project / ".github" / "copilot-instructions.md"
+AGENT_INSTRUCTION_PATHS = [
+    pytest.param(agent, expected, id=agent)
+    for agent, expected in [
+        ("claude", Path("CLAUDE.md")),
+        ("copilot", Path(".github") / "copilot-instructions.md"),
+        ("cursor", Path("AGENTS.md")),
+        ("codex", Path("AGENTS.md")),
+        ("gemini", Path("GEMINI.md")),
+        ("windsurf", Path(".windsurf") / "rules" / "rules.md"),
+    ]
+]
 
-    def test_returns_correct_path_for_cursor(self, initialized_project: Path) -> None:
-        """Test get_agent_instruction_file returns correct path for Cursor."""
-        service = AgentService(initialized_project)
-        path = service.get_agent_instruction_file("cursor")
-        assert path == initialized_project / "AGENTS.md"
 
-    def test_returns_correct_path_for_codex(self, initialized_project: Path) -> None:
-        """Test get_agent_instruction_file returns correct path for Codex."""
-        service = AgentService(initialized_project)
-        path = service.get_agent_instruction_file("codex")
-        assert path == initialized_project / "AGENTS.md"
-
-    def test_returns_correct_path_for_gemini(self, initialized_project: Path) -> None:
-        """Test get_agent_instruction_file returns correct path for Gemini."""
-        service = AgentService(initialized_project)
-        path = service.get_agent_instruction_file("gemini")
-        assert path == initialized_project / "GEMINI.md"
+class TestGetAgentInstructionFile:
+    """Tests for get_agent_instruction_file method."""
 
-    def test_returns_correct_path_for_windsurf(self, initialized_project: Path) -> None:
-        """Test get_agent_instruction_file returns correct path for Windsurf."""
-        service = AgentService(initialized_project)
-        path = service.get_agent_instruction_file("windsurf")
-        assert path == initialized_project / ".windsurf" / "rules" / "rules.md"
+    @pytest.mark.parametrize(("agent", "expected_relative"), AGENT_INSTRUCTION_PATHS)
+    def test_returns_correct_path(
+        self, empty_project_dir: Path, agent: str, expected_relative: Path
+    ) -> None:
+        """Test get_agent_instruction_file returns the agent's instruction file path."""
+        service = AgentService(empty_project_dir)
+        path = service.get_agent_instruction_file(agent)
+        assert path == empty_project_dir / expected_relative
 
-    def test_handles_unknown_agent_type(self, initialized_project: Path) -> None:
+    def test_handles_unknown_agent_type(self, empty_project_dir: Path) -> None:
         """Test that unknown agent type raises ValueError."""
-        service = AgentService(initialized_project)
+        service = AgentService(empty_project_dir)
         with pytest.raises(ValueError, match="Unknown agent type: unknown"):
             service.get_agent_instruction_file("unknown")
 
-    def test_case_insensitive_agent_type(self, initialized_project: Path) -> None:
+    def test_case_insensitive_agent_type(self, empty_project_dir: Path) -> None:
         """Test that agent type is case-insensitive."""
-        service = AgentService(initialized_project)
+        service = AgentService(empty_project_dir)
         path_upper = service.get_agent_instruction_file("CLAUDE")
-        assert path_upper == initialized_project / "CLAUDE.md"
+        assert path_upper == empty_project_dir / "CLAUDE.md"
         path_mixed = service.get_agent_instruction_file("ClAuDe")
-        assert path_mixed == initialized_project / "CLAUDE.md"
+        assert path_mixed == empty_project_dir / "CLAUDE.md"
+
+    def test_shares_manifest_paths_across_instances(
+        self, empty_project_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that a new service for another project reuses manifest-derived paths."""
+        AgentService(empty_project_dir).get_agent_instruction_file("copilot")
+        service = AgentService(tmp_path)
+        with patch.object(service, "get_agent_manifest") as get_manifest:
+            path = service.get_agent_instruction_file("copilot")
+        get_manifest.assert_not_called()
+        assert path == tmp_path / ".github" / "copilot-instructions.md"
 
 
 class TestDetectExistingAgentInstructions:
     """Tests for detect_existing_agent_instructions method."""
 
-    def test_detects_existing_copilot_instructions(self, initialized_project: Path) -> None:
+    def test_detects_existing_copilot_instructions(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test detection of existing copilot instructions."""
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
+        copilot_file = initialized_project / ".github" / "copilot-instructions.md"
         test_content = "# Team Instructions\n\nOur conventions..."
-        copilot_file.write_text(test_content, encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        seed_project({".github/copilot-instructions.md": test_content})
+        seed_config(["copilot"])
+        existing = agent_service.detect_existing_agent_instructions()
         assert "copilot" in existing
         assert existing["copilot"]["exists"] is True
         assert existing["copilot"]["content"] == test_content
@@ -83,40 +95,64 @@ class TestDetectExistingAgentInstructions:
         assert existing["copilot"]["has_constitution_ref"] is False
         assert existing["copilot"]["path"] == copilot_file
 
-    def test_returns_info_for_nonexistent_file(self, initialized_project: Path) -> None:
+    def test_returns_info_for_nonexistent_file(
+        self, initialized_project: Path, seed_config: SeedConfig, agent_service: AgentService
+    ) -> None:
         """Test detection when instruction file doesn't exist."""
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude"])
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        seed_config(["claude"])
+        existing = agent_service.detect_existing_agent_instructions()
         assert "claude" in existing
         assert existing["claude"]["exists"] is False
         assert existing["claude"]["content"] is None
         assert existing["claude"]["has_constitution_ref"] is False
         assert existing["claude"]["path"] == initialized_project / "CLAUDE.md"
 
-    def test_detects_constitution_reference(self, initialized_project: Path) -> None:
+    def test_detects_constitution_reference(
+        self,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test detection when file has constitution reference."""
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
         content_with_ref = "# Team Instructions\n\nOur conventions...\n\n## Project Constitution\n\nSee [oak/constitution.md](../oak/constitution.md)\n"
-        copilot_file.write_text(content_with_ref, encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        seed_project({".github/copilot-instructions.md": content_with_ref})
+        seed_config(["copilot"])
+        existing = agent_service.detect_existing_agent_instructions()
         assert existing["copilot"]["exists"] is True
         assert existing["copilot"]["has_constitution_ref"] is True
 
-    def test_handles_shared_files(self, initialized_project: Path) -> None:
+    def test_reads_instruction_file_once(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
+        """Test that detection reads the file once without a separate existence check."""
+        claude_file = initialized_project / "CLAUDE.md"
+        seed_project({"CLAUDE.md": "See constitution: oak/constitution.md\n"})
+        seed_config(["claude"])
+        with (
+            patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read,
+            patch.object(Path, "exists", autospec=True, side_effect=Path.exists) as exists,
+        ):
+            existing = agent_service.detect_existing_agent_instructions()
+        assert [call.args[0] for call in read.call_args_list] == [claude_file]
+        assert claude_file not in [call.args[0] for call in exists.call_args_list]
+        assert existing["claude"]["has_constitution_ref"] is True
+
+    def test_handles_shared_files(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test that cursor and codex both detect the same AGENTS.md file."""
         agents_file = initialized_project / "AGENTS.md"
-        agents_file.write_text("# AI Assistant Instructions\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["cursor", "codex"])
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        seed_project({"AGENTS.md": "# AI Assistant Instructions\n"})
+        seed_config(["cursor", "codex"])
+        existing = agent_service.detect_existing_agent_instructions()
         assert "cursor" in existing
         assert "codex" in existing
         assert existing["cursor"]["exists"] is True
@@ -124,145 +160,163 @@ class TestDetectExistingAgentInstructions:
         assert existing["cursor"]["path"] == agents_file
         assert existing["codex"]["path"] == agents_file
 
-    def test_handles_multiple_agents(self, initialized_project: Path) -> None:
+    def test_reads_shared_file_once(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
+        """Test that agents sharing AGENTS.md get one read and independent results."""
+        agents_file = initialized_project / "AGENTS.md"
+        seed_project({"AGENTS.md": "# AI Assistant Instructions\n"})
+        seed_config(["cursor", "codex"])
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read:
+            existing = agent_service.detect_existing_agent_instructions()
+        assert [call.args[0] for call in read.call_args_list] == [agents_file]
+        assert existing["cursor"] == existing["codex"]
+        assert existing["cursor"] is not existing["codex"]
+
+    def test_handles_multiple_agents(
+        self,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test detection with multiple agents configured."""
         # CLAUDE.md is at project root (not in .claude/)
-        claude_file = initialized_project / "CLAUDE.md"
-        claude_file.write_text("# Claude Instructions\n", encoding="utf-8")
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
-        copilot_file.write_text("# Copilot Instructions\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude", "copilot"])
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        seed_project(
+            {
+                "CLAUDE.md": "# Claude Instructions\n",
+                ".github/copilot-instructions.md": "# Copilot Instructions\n",
+            }
+        )
+        seed_config(["claude", "copilot"])
+        existing = agent_service.detect_existing_agent_instructions()
         assert len(existing) == 2
         assert existing["claude"]["exists"] is True
         assert existing["copilot"]["exists"] is True
 
-    def test_empty_result_when_no_agents_configured(self, initialized_project: Path) -> None:
+    def test_empty_result_when_no_agents_configured(self, agent_service: AgentService) -> None:
         """Test that detection returns empty dict when no agents configured."""
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        existing = agent_service.detect_existing_agent_instructions()
         assert existing == {}
 
-    def test_handles_unreadable_file(self, initialized_project: Path) -> None:
+    def test_handles_unreadable_file(
+        self,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test handling of existing but unreadable file."""
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
-        copilot_file.write_text("# Instructions\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        existing = service.detect_existing_agent_instructions()
+        seed_project({".github/copilot-instructions.md": "# Instructions\n"})
+        seed_config(["copilot"])
+        existing = agent_service.detect_existing_agent_instructions()
         assert "copilot" in existing
 
 
-class TestHasConstitutionReference:
-    """Tests for _has_constitution_reference method."""
-
-    def test_returns_true_for_project_constitution_header(self, temp_project_dir: Path) -> None:
-        """Test detection of '## Project Constitution' header."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text(
-            "\n# Instructions\n\nSome content here.\n\n## Project Constitution\n\nReference to constitution.\n",
-            encoding="utf-8",
-        )
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is True
-
-    def test_returns_true_for_constitution_file_path(self, temp_project_dir: Path) -> None:
-        """Test detection of 'oak/constitution.md' reference."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text(
-            "\n# Instructions\n\nSee [constitution](oak/constitution.md) for details.\n",
-            encoding="utf-8",
-        )
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is True
-
-    def test_returns_true_for_dot_oak_constitution_path(self, temp_project_dir: Path) -> None:
-        """Test detection of '.oak/constitution.md' reference."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text(
-            "\nSee [.oak/constitution.md](.oak/constitution.md)\n", encoding="utf-8"
-        )
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is True
-
-    def test_returns_false_for_no_reference(self, temp_project_dir: Path) -> None:
-        """Test that file without reference returns False."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text(
-            "\n# Instructions\n\nRegular content without constitution reference.\n",
-            encoding="utf-8",
-        )
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is False
-
-    def test_returns_false_for_nonexistent_file(self, temp_project_dir: Path) -> None:
-        """Test that non-existent file returns False."""
-        nonexistent_file = temp_project_dir / "does-not-exist.md"
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(nonexistent_file) is False
-
-    def test_case_insensitive_check(self, temp_project_dir: Path) -> None:
-        """Test that detection is case-insensitive."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text(
-            "\n## project constitution\n\\OAK/CONSTITUTION.MD reference.\n", encoding="utf-8"
-        )
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is True
-
-    def test_detects_various_header_levels(self, temp_project_dir: Path) -> None:
+@pytest.fixture(scope="class")
+def shared_service(empty_project_dir: Path) -> AgentService:
+    """Share one read-only AgentService across a test class."""
+    return AgentService(empty_project_dir)
+
+
+class TestContentHasConstitutionReference:
+    """Tests for _content_has_constitution_reference method."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(
+                "\n# Instructions\n\nSome content here.\n\n## Project Constitution\n\nReference to constitution.\n",
+                True,
+                id="project_constitution_header",
+            ),
+            pytest.param(
+                "\n# Instructions\n\nSee [constitution](oak/constitution.md) for details.\n",
+                True,
+                id="constitution_file_path",
+            ),
+            pytest.param(
+                "\nSee [.oak/constitution.md](.oak/constitution.md)\n",
+                True,
+                id="dot_oak_constitution_path",
+            ),
+            pytest.param(
+                "\n## project constitution\n\\OAK/CONSTITUTION.MD reference.\n",
+                True,
+                id="case_insensitive",
+            ),
+            pytest.param(
+                "See constitution: ../oak/constitution.md", True, id="see_constitution_reference"
+            ),
+            pytest.param(
+                "CONSTITUTION FILE: docs/standards.md", True, id="constitution_file_reference"
+            ),
+            pytest.param(
+                "Read the [constitution](../oak/constitution.md)",
+                True,
+                id="markdown_link_reference",
+            ),
+            pytest.param(
+                "\n# Instructions\n\nRegular content without constitution reference.\n",
+                False,
+                id="no_reference",
+            ),
+            pytest.param(
+                "Project constitution pending.\nSee constitution.md later.\n",
+                False,
+                id="partial_marker_text",
+            ),
+        ],
+    )
+    def test_detects_reference(self, content: str, expected: bool) -> None:
+        """Test reference detection for marker and non-marker content."""
+        assert AgentService._content_has_constitution_reference(content) is expected
+
+    @pytest.mark.parametrize("marker", CONSTITUTION_REFERENCE_MARKERS)
+    def test_every_marker_passes_keyword_prefilter(self, marker: str) -> None:
+        """Test each marker contains the keyword used to reject content early."""
+        assert CONSTITUTION_REFERENCE_KEYWORD in marker.lower()
+        assert AgentService._content_has_constitution_reference(f"x {marker.upper()} x")
+
+    @pytest.mark.parametrize("header", ["#", "##", "###"])
+    def test_detects_various_header_levels(self, header: str) -> None:
         """Test detection of constitution header at different levels."""
-        test_cases = [
-            "# Project Constitution",
-            "## Project Constitution",
-            "### Project Constitution",
-        ]
-        service = AgentService(temp_project_dir)
-        for header in test_cases:
-            test_file = temp_project_dir / f"test_{header.count('#')}.md"
-            test_file.write_text(f"{header}\n\nContent", encoding="utf-8")
-            assert service._has_constitution_reference(test_file) is True
-
-    def test_detects_see_constitution_reference(self, temp_project_dir: Path) -> None:
-        """Test detection of 'See constitution:' text."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text("See constitution: ../oak/constitution.md", encoding="utf-8")
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is True
+        content = f"{header} Project Constitution\n\nContent"
+        assert AgentService._content_has_constitution_reference(content) is True
 
-    def test_detects_markdown_link_reference(self, temp_project_dir: Path) -> None:
-        """Test detection of [constitution] or [Constitution] markdown link."""
-        test_file = temp_project_dir / "test.md"
-        test_file.write_text("Read the [constitution](../oak/constitution.md)", encoding="utf-8")
-        service = AgentService(temp_project_dir)
-        assert service._has_constitution_reference(test_file) is True
+    def test_nonexistent_file_has_no_reference(
+        self, shared_service: AgentService, tmp_path: Path
+    ) -> None:
+        """Test that a non-existent instruction file is reported without a reference."""
+        info = shared_service._detect_instruction_file(tmp_path / "does-not-exist.md")
+        assert info["exists"] is False
+        assert info["has_constitution_ref"] is False
 
 
 class TestUpdateAgentInstructionsFromConstitution:
     """Tests for update_agent_instructions_from_constitution method."""
 
-    def test_updates_existing_file_without_reference(self, initialized_project: Path) -> None:
+    def test_updates_existing_file_without_reference(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test appending reference to existing file without constitution reference."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        copilot_file = initialized_project / ".github" / "copilot-instructions.md"
         original_content = "# Team Instructions\n\nOur conventions..."
-        copilot_file.write_text(original_content, encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                ".github/copilot-instructions.md": original_content,
+            }
+        )
+        seed_config(["copilot"])
+        results = agent_service.update_agent_instructions_from_constitution(
             constitution_file, mode="additive"
         )
         assert "copilot" in results["updated"]
@@ -274,57 +328,90 @@ class TestUpdateAgentInstructionsFromConstitution:
         assert "## Project Constitution" in updated_content
         assert "oak/constitution.md" in updated_content
 
-    def test_creates_backup_before_updating(self, initialized_project: Path) -> None:
+    def test_reuses_detected_content_when_appending(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
+        """Test the updater appends to the content read during detection."""
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        claude_file = initialized_project / "CLAUDE.md"
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                "CLAUDE.md": "# Claude\n",
+            }
+        )
+        seed_config(["claude"])
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read:
+            results = agent_service.update_agent_instructions_from_constitution(constitution_file)
+        assert [call.args[0] for call in read.call_args_list].count(claude_file) == 1
+        assert results["updated"] == ["claude"]
+        assert "## Project Constitution" in claude_file.read_text(encoding="utf-8")
+
+    def test_creates_backup_before_updating(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test that backup file is created before updating."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        copilot_file = initialized_project / ".github" / "copilot-instructions.md"
         original_content = "# Original Content\n"
-        copilot_file.write_text(original_content, encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(constitution_file)
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                ".github/copilot-instructions.md": original_content,
+            }
+        )
+        seed_config(["copilot"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
         backup_file = copilot_file.with_suffix(copilot_file.suffix + ".backup")
         assert backup_file.exists()
         assert backup_file.read_text(encoding="utf-8") == original_content
         assert str(backup_file) in results["backed_up"]
 
-    def test_skips_file_that_already_has_reference(self, initialized_project: Path) -> None:
+    def test_skips_file_that_already_has_reference(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test idempotency - skips file that already has reference."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        copilot_file = initialized_project / ".github" / "copilot-instructions.md"
         content_with_ref = "# Instructions\n\n## Project Constitution\nAlready has reference to oak/constitution.md\n"
-        copilot_file.write_text(content_with_ref, encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(constitution_file)
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                ".github/copilot-instructions.md": content_with_ref,
+            }
+        )
+        seed_config(["copilot"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "copilot" in results["skipped"]
         assert "copilot" not in results["updated"]
         assert "copilot" not in results["created"]
         assert len(results["backed_up"]) == 0
         assert copilot_file.read_text(encoding="utf-8") == content_with_ref
 
-    def test_creates_new_file_if_doesnt_exist(self, initialized_project: Path) -> None:
+    def test_creates_new_file_if_doesnt_exist(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test creating new instruction file when none exists."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(constitution_file)
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        seed_project({"oak/constitution.md": "# Project Constitution\n"})
+        seed_config(["claude"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "claude" in results["created"]
         assert "claude" not in results["updated"]
         assert "claude" not in results["skipped"]
@@ -334,16 +421,18 @@ class TestUpdateAgentInstructionsFromConstitution:
         assert "## Project Constitution" in content
         assert "oak/constitution.md" in content
 
-    def test_handles_shared_files(self, initialized_project: Path) -> None:
+    def test_handles_shared_files(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test updating shared files (cursor and codex use AGENTS.md)."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["cursor", "codex"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(constitution_file)
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        seed_project({"oak/constitution.md": "# Project Constitution\n"})
+        seed_config(["cursor", "codex"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "cursor" in results["created"]
         assert "codex" in results["created"]
         agents_file = initialized_project / "AGENTS.md"
@@ -351,46 +440,75 @@ class TestUpdateAgentInstructionsFromConstitution:
         content = agents_file.read_text(encoding="utf-8")
         assert "## Project Constitution" in content
 
-    def test_returns_error_if_constitution_not_found(self, initialized_project: Path) -> None:
+    def test_returns_error_if_constitution_not_found(
+        self, initialized_project: Path, seed_config: SeedConfig, agent_service: AgentService
+    ) -> None:
         """Test error handling when constitution file doesn't exist."""
         nonexistent_constitution = initialized_project / "oak" / "nonexistent.md"
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(nonexistent_constitution)
+        seed_config(["claude"])
+        results = agent_service.update_agent_instructions_from_constitution(
+            nonexistent_constitution
+        )
         assert len(results["errors"]) > 0
         assert "not found" in results["errors"][0].lower()
 
-    def test_skip_mode_preserves_existing_files(self, initialized_project: Path) -> None:
+    def test_results_are_lists_of_strings(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
+        """Test every result category is a JSON-ready list of strings."""
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                "CLAUDE.md": "# Claude Instructions\n",
+            }
+        )
+        seed_config(["claude", "copilot"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
+        assert set(results) == {"updated", "created", "skipped", "backed_up", "errors"}
+        assert all(isinstance(item, str) for items in results.values() for item in items)
+        assert results["backed_up"]
+
+    def test_skip_mode_preserves_existing_files(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test skip mode doesn't modify existing files."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        copilot_file = initialized_project / ".github" / "copilot-instructions.md"
         original_content = "# Team Instructions\n"
-        copilot_file.write_text(original_content, encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["copilot"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                ".github/copilot-instructions.md": original_content,
+            }
+        )
+        seed_config(["copilot"])
+        results = agent_service.update_agent_instructions_from_constitution(
             constitution_file, mode="skip"
         )
         assert "copilot" in results["skipped"]
         assert copilot_file.read_text(encoding="utf-8") == original_content
 
-    def test_skip_mode_creates_new_files(self, initialized_project: Path) -> None:
+    def test_skip_mode_creates_new_files(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test skip mode still creates new files when they don't exist."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        seed_project({"oak/constitution.md": "# Project Constitution\n"})
+        seed_config(["claude"])
+        results = agent_service.update_agent_instructions_from_constitution(
             constitution_file, mode="skip"
         )
         assert "claude" in results["created"]
@@ -401,73 +519,160 @@ class TestUpdateAgentInstructionsFromConstitution:
 class TestAppendConstitutionReference:
     """Tests for _append_constitution_reference method."""
 
-    def test_appends_reference_to_existing_file(self, temp_project_dir: Path) -> None:
+    def test_appends_reference_to_existing_file(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
         """Test appending constitution reference to existing file."""
-        test_file = temp_project_dir / "instructions.md"
         original_content = "# Original Instructions\n\nSome content here."
-        test_file.write_text(original_content, encoding="utf-8")
+        seed_project(
+            {"instructions.md": original_content, "oak/constitution.md": CONSTITUTION_CONTENT}
+        )
+        test_file = temp_project_dir / "instructions.md"
         constitution_file = temp_project_dir / "oak" / "constitution.md"
-        constitution_file.parent.mkdir(parents=True, exist_ok=True)
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         backup_path = service._append_constitution_reference(test_file, constitution_file)
         assert backup_path.exists()
-        assert backup_path.read_text(encoding="utf-8") == original_content
-        updated_content = test_file.read_text(encoding="utf-8")
-        assert original_content in updated_content
-        assert "## Project Constitution" in updated_content
-        assert "oak/constitution.md" in updated_content
-
-    def test_creates_backup_with_backup_extension(self, temp_project_dir: Path) -> None:
+        assert backup_path.read_bytes() == original_content.encode("utf-8")
+        updated_content = test_file.read_bytes()
+        assert original_content.encode("utf-8") in updated_content
+        assert b"## Project Constitution" in updated_content
+        assert b"oak/constitution.md" in updated_content
+
+    def test_creates_backup_with_backup_extension(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
         """Test backup file has .backup extension."""
+        seed_project(
+            {"instructions.md": "Original content", "constitution.md": CONSTITUTION_CONTENT}
+        )
         test_file = temp_project_dir / "instructions.md"
-        test_file.write_text("Original content", encoding="utf-8")
         constitution_file = temp_project_dir / "constitution.md"
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         backup_path = service._append_constitution_reference(test_file, constitution_file)
         assert backup_path == test_file.with_suffix(".md.backup")
         assert backup_path.name == "instructions.md.backup"
 
-    def test_preserves_original_content(self, temp_project_dir: Path) -> None:
-        """Test that original content is preserved in updated file."""
+    @pytest.mark.parametrize("file_name", ["AGENTS", ".cursorrules", "rules.v2.md"])
+    def test_backup_appends_extension_to_full_name(
+        self, temp_project_dir: Path, seed_project: SeedProject, file_name: str
+    ) -> None:
+        """Test backup name keeps the whole original name, with or without a suffix."""
+        seed_project({file_name: "Original content", "constitution.md": CONSTITUTION_CONTENT})
+        test_file = temp_project_dir / file_name
+        constitution_file = temp_project_dir / "constitution.md"
+        service = AgentService(temp_project_dir)
+        backup_path = service._append_constitution_reference(test_file, constitution_file)
+        assert backup_path == temp_project_dir / f"{file_name}.backup"
+
+    def test_backup_replaces_stale_backup_and_keeps_file(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
+        """Test a stale backup is overwritten and the original file is updated in place."""
+        seed_project(
+            {
+                "instructions.md": "Original content",
+                "instructions.md.backup": "Stale backup",
+                "constitution.md": CONSTITUTION_CONTENT,
+            }
+        )
         test_file = temp_project_dir / "instructions.md"
+        test_file.chmod(0o640)
+        original_inode = test_file.stat().st_ino
+        constitution_file = temp_project_dir / "constitution.md"
+        service = AgentService(temp_project_dir)
+        backup_path = service._append_constitution_reference(test_file, constitution_file)
+        assert backup_path.read_bytes() == b"Original content"
+        assert test_file.stat().st_ino == original_inode
+        assert test_file.stat().st_mode & 0o777 == 0o640
+
+    def test_updates_symlink_target(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
+        """Test a symlinked instruction file stays a link and its target gets the reference."""
+        seed_project({"CLAUDE.md": "Original content", "constitution.md": CONSTITUTION_CONTENT})
+        target = temp_project_dir / "CLAUDE.md"
+        link = temp_project_dir / "AGENTS.md"
+        link.symlink_to(target.name)
+        constitution_file = temp_project_dir / "constitution.md"
+        service = AgentService(temp_project_dir)
+        backup_path = service._append_constitution_reference(link, constitution_file)
+        assert link.is_symlink()
+        assert b"## Project Constitution" in target.read_bytes()
+        assert not backup_path.is_symlink()
+        assert backup_path.read_bytes() == b"Original content"
+
+    def test_preserves_original_content(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
+        """Test that original content is preserved in updated file."""
         original_content = "# Team Instructions\n\n## Coding Standards\n\nFollow PEP 8.\n\n## Review Process\n\nAll PRs need approval.\n"
-        test_file.write_text(original_content, encoding="utf-8")
+        seed_project({"instructions.md": original_content, "constitution.md": CONSTITUTION_CONTENT})
+        test_file = temp_project_dir / "instructions.md"
         constitution_file = temp_project_dir / "constitution.md"
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         service._append_constitution_reference(test_file, constitution_file)
-        updated_content = test_file.read_text(encoding="utf-8")
-        assert "# Team Instructions" in updated_content
-        assert "## Coding Standards" in updated_content
-        assert "Follow PEP 8." in updated_content
-        assert "## Review Process" in updated_content
-
-    def test_calculates_correct_relative_path(self, temp_project_dir: Path) -> None:
+        updated_content = test_file.read_bytes()
+        assert b"# Team Instructions" in updated_content
+        assert b"## Coding Standards" in updated_content
+        assert b"Follow PEP 8." in updated_content
+        assert b"## Review Process" in updated_content
+
+    def test_calculates_correct_relative_path(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
         """Test that relative path is calculated correctly."""
-        instruction_dir = temp_project_dir / ".github"
-        instruction_dir.mkdir(parents=True, exist_ok=True)
-        test_file = instruction_dir / "copilot-instructions.md"
-        test_file.write_text("# Instructions\n", encoding="utf-8")
+        seed_project(
+            {
+                ".github/copilot-instructions.md": "# Instructions\n",
+                "oak/constitution.md": CONSTITUTION_CONTENT,
+            }
+        )
+        test_file = temp_project_dir / ".github" / "copilot-instructions.md"
         constitution_file = temp_project_dir / "oak" / "constitution.md"
-        constitution_file.parent.mkdir(parents=True, exist_ok=True)
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         service._append_constitution_reference(test_file, constitution_file)
-        updated_content = test_file.read_text(encoding="utf-8")
-        assert "../oak/constitution.md" in updated_content
+        updated_content = test_file.read_bytes()
+        assert b"../oak/constitution.md" in updated_content
+
+
+class TestRelativeConstitutionPath:
+    """Tests for _relative_constitution_path helper."""
+
+    @pytest.mark.parametrize(
+        ("agent_dir", "expected"),
+        [
+            pytest.param(Path("/project"), "oak/constitution.md", id="root"),
+            pytest.param(Path("/project/.github"), "../oak/constitution.md", id="depth_1"),
+            pytest.param(
+                Path("/project/.windsurf/rules"), "../../oak/constitution.md", id="depth_2"
+            ),
+        ],
+    )
+    def test_returns_posix_relative_path(self, agent_dir: Path, expected: str) -> None:
+        """Test relative path from agent file directory to constitution."""
+        constitution = Path("/project/oak/constitution.md")
+        assert _relative_constitution_path(agent_dir, constitution) == expected
+
+    def test_falls_back_to_constitution_path(self) -> None:
+        """Test fallback when no relative path exists between the two paths."""
+        _relative_constitution_path.cache_clear()
+        constitution = Path("/project/oak/constitution.md")
+        with patch("os.path.relpath", side_effect=ValueError):
+            result = _relative_constitution_path(Path("/other"), constitution)
+        _relative_constitution_path.cache_clear()
+        assert result == "/project/oak/constitution.md"
 
 
 class TestCreateAgentInstructionFile:
     """Tests for _create_agent_instruction_file method."""
 
-    def test_creates_new_file_with_constitution_reference(self, temp_project_dir: Path) -> None:
+    def test_creates_new_file_with_constitution_reference(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
         """Test creating new instruction file with constitution reference."""
         file_path = temp_project_dir / "CLAUDE.md"
+        seed_project({"oak/constitution.md": CONSTITUTION_CONTENT})
         constitution_file = temp_project_dir / "oak" / "constitution.md"
-        constitution_file.parent.mkdir(parents=True, exist_ok=True)
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         service._create_agent_instruction_file(file_path, constitution_file, ["claude"])
         assert file_path.exists()
@@ -477,22 +682,24 @@ class TestCreateAgentInstructionFile:
         # CLAUDE.md is at project root, so path to oak/constitution.md is direct
         assert "oak/constitution.md" in content
 
-    def test_handles_single_agent(self, temp_project_dir: Path) -> None:
+    def test_handles_single_agent(self, temp_project_dir: Path, seed_project: SeedProject) -> None:
         """Test creating file for single agent."""
         file_path = temp_project_dir / "CLAUDE.md"
+        seed_project({"constitution.md": CONSTITUTION_CONTENT})
         constitution_file = temp_project_dir / "constitution.md"
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         service._create_agent_instruction_file(file_path, constitution_file, ["claude"])
         content = file_path.read_text(encoding="utf-8")
         assert "Claude Code" in content
         assert "This file contains instructions for Claude Code" in content
 
-    def test_handles_multiple_agents(self, temp_project_dir: Path) -> None:
+    def test_handles_multiple_agents(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
         """Test creating shared file for multiple agents."""
         file_path = temp_project_dir / "AGENTS.md"
+        seed_project({"constitution.md": CONSTITUTION_CONTENT})
         constitution_file = temp_project_dir / "constitution.md"
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         service = AgentService(temp_project_dir)
         service._create_agent_instruction_file(file_path, constitution_file, ["cursor", "codex"])
         content = file_path.read_text(encoding="utf-8")
@@ -500,11 +707,13 @@ class TestCreateAgentInstructionFile:
         assert "Cursor" in content or "Codex" in content
         assert "## Project Constitution" in content
 
-    def test_creates_parent_directories(self, temp_project_dir: Path) -> None:
+    def test_creates_parent_directories(
+        self, temp_project_dir: Path, seed_project: SeedProject
+    ) -> None:
         """Test that parent directories are created if needed."""
         file_path = temp_project_dir / ".windsurf" / "rules" / "rules.md"
+        seed_project({"constitution.md": CONSTITUTION_CONTENT})
         constitution_file = temp_project_dir / "constitution.md"
-        constitution_file.write_text("# Constitution\n", encoding="utf-8")
         assert not file_path.parent.exists()
         service = AgentService(temp_project_dir)
         service._create_agent_instruction_file(file_path, constitution_file, ["windsurf"])
@@ -515,16 +724,18 @@ class TestCreateAgentInstructionFile:
 class TestIntegration:
     """Integration tests for agent instruction management."""
 
-    def test_full_workflow_new_project(self, initialized_project: Path) -> None:
+    def test_full_workflow_new_project(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test complete workflow for new project."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude", "copilot", "cursor"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(constitution_file)
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        seed_project({"oak/constitution.md": "# Project Constitution\n"})
+        seed_config(["claude", "copilot", "cursor"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert set(results["created"]) == {"claude", "copilot", "cursor"}
         assert len(results["updated"]) == 0
         assert len(results["skipped"]) == 0
@@ -533,75 +744,73 @@ class TestIntegration:
         assert (initialized_project / ".github" / "copilot-instructions.md").exists()
         assert (initialized_project / "AGENTS.md").exists()
 
-    def test_full_workflow_existing_project(self, initialized_project: Path) -> None:
+    def test_full_workflow_existing_project(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test workflow for project with existing instruction files."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
+        constitution_file = initialized_project / "oak" / "constitution.md"
         # CLAUDE.md is at project root (not in .claude/)
-        claude_file = initialized_project / "CLAUDE.md"
-        claude_file.write_text("# Existing Claude instructions\n", encoding="utf-8")
-        copilot_dir = initialized_project / ".github"
-        copilot_dir.mkdir(parents=True, exist_ok=True)
-        copilot_file = copilot_dir / "copilot-instructions.md"
-        copilot_file.write_text(
-            "# Copilot\n\n## Project Constitution\nAlready has reference\n", encoding="utf-8"
+        seed_project(
+            {
+                "oak/constitution.md": "# Project Constitution\n",
+                "CLAUDE.md": "# Existing Claude instructions\n",
+                ".github/copilot-instructions.md": "# Copilot\n\n## Project Constitution\nAlready has reference\n",
+            }
         )
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude", "copilot", "cursor"])
-        service = AgentService(initialized_project)
-        results = service.update_agent_instructions_from_constitution(constitution_file)
+        seed_config(["claude", "copilot", "cursor"])
+        results = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "claude" in results["updated"]
         assert "copilot" in results["skipped"]
         assert "cursor" in results["created"]
 
-    def test_idempotency(self, initialized_project: Path) -> None:
+    def test_idempotency(
+        self,
+        initialized_project: Path,
+        seed_project: SeedProject,
+        seed_config: SeedConfig,
+        agent_service: AgentService,
+    ) -> None:
         """Test running update multiple times is idempotent."""
-        constitution_dir = initialized_project / "oak"
-        constitution_dir.mkdir(parents=True, exist_ok=True)
-        constitution_file = constitution_dir / "constitution.md"
-        constitution_file.write_text("# Project Constitution\n", encoding="utf-8")
-        config_service = ConfigService(initialized_project)
-        config_service.create_default_config(agents=["claude"])
-        service = AgentService(initialized_project)
-        results1 = service.update_agent_instructions_from_constitution(constitution_file)
+        constitution_file = initialized_project / "oak" / "constitution.md"
+        seed_project({"oak/constitution.md": "# Project Constitution\n"})
+        seed_config(["claude"])
+        results1 = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "claude" in results1["created"]
-        results2 = service.update_agent_instructions_from_constitution(constitution_file)
+        results2 = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "claude" in results2["skipped"]
-        results3 = service.update_agent_instructions_from_constitution(constitution_file)
+        results3 = agent_service.update_agent_instructions_from_constitution(constitution_file)
         assert "claude" in results3["skipped"]
-        backup_file = initialized_project / ".claude" / "CLAUDE.md.backup"
-        assert not backup_file.exists()
+        assert results1["backed_up"] == results2["backed_up"] == results3["backed_up"] == []
 
 
 class TestGetAgentContext:
     """Tests for get_agent_context method - capability-aware template rendering."""
 
-    def test_get_agent_context_returns_dict(self, initialized_project: Path) -> None:
+    def test_get_agent_context_returns_dict(self, agent_service: AgentService) -> None:
         """Test get_agent_context returns a dictionary."""
-        service = AgentService(initialized_project)
-        context = service.get_agent_context("claude")
+        context = agent_service.get_agent_context("claude")
 
         assert isinstance(context, dict)
         assert "agent_type" in context
 
-    def test_get_agent_context_includes_capabilities(self, initialized_project: Path) -> None:
+    def test_get_agent_context_includes_capabilities(self, agent_service: AgentService) -> None:
         """Test get_agent_context includes capability flags."""
-        service = AgentService(initialized_project)
-        context = service.get_agent_context("claude")
+        context = agent_service.get_agent_context("claude")
 
         # Should include capability flags from manifest
         assert "has_background_agents" in context
         assert "has_native_web" in context
         assert "has_mcp" in context
 
-    def test_get_agent_context_different_agents(self, initialized_project: Path) -> None:
+    def test_get_agent_context_different_agents(self, agent_service: AgentService) -> None:
         """Test different agents may have different capabilities."""
-        service = AgentService(initialized_project)
 
-        claude_context = service.get_agent_context("claude")
-        copilot_context = service.get_agent_context("copilot")
+        claude_context = agent_service.get_agent_context("claude")
+        copilot_context = agent_service.get_agent_context("copilot")
 
         # Both should have agent_type set correctly
         assert claude_context["agent_type"] == "claude"
@@ -609,8 +818,6 @@ class TestGetAgentContext:
 
     def test_get_agent_context_applies_config_overrides(self, initialized_project: Path) -> None:
         """Test that config overrides are applied to context."""
-        from open_agent_kit.models.config import AgentCapabilitiesConfig
-
         service = AgentService(initialized_project)
         config_service = ConfigService(initialized_project)
 
@@ -632,8 +839,6 @@ class TestGetAgentContext:
 
     def test_get_agent_context_partial_overrides(self, initialized_project: Path) -> None:
         """Test partial overrides only affect specified fields."""
-        from open_agent_kit.models.config import AgentCapabilitiesConfig
-
         service = AgentService(initialized_project)
         config_service = ConfigService(initialized_project)
 
@@ -657,44 +862,77 @@ class TestGetAgentContext:
         # Non-overridden fields should retain original values
         assert context["has_mcp"] == original_mcp
 
-    def test_get_agent_context_case_insensitive(self, initialized_project: Path) -> None:
+    def test_get_agent_context_case_insensitive(self, agent_service: AgentService) -> None:
         """Test agent type lookup is case insensitive."""
-        service = AgentService(initialized_project)
 
-        context_lower = service.get_agent_context("claude")
-        context_upper = service.get_agent_context("CLAUDE")
-        context_mixed = service.get_agent_context("Claude")
+        context_lower = agent_service.get_agent_context("claude")
+        context_upper = agent_service.get_agent_context("CLAUDE")
+        context_mixed = agent_service.get_agent_context("Claude")
 
         assert context_lower["agent_type"] == "claude"
         assert context_upper["agent_type"] == "claude"
         assert context_mixed["agent_type"] == "claude"
 
+    def test_get_agent_context_reuses_manifest_across_services(
+        self, agent_service: AgentService, initialized_project: Path
+    ) -> None:
+        """Test a new service builds the context without loading the manifest again."""
+        expected = agent_service.get_agent_context("claude")
+        with patch.object(
+            AgentService, "get_agent_manifest", side_effect=AssertionError("reloaded")
+        ):
+            context = AgentService(initialized_project).get_agent_context("claude")
+        assert context == expected
+
+    def test_get_agent_context_overrides_stay_per_project(
+        self, initialized_project: Path, empty_project_dir: Path
+    ) -> None:
+        """Test one project's overrides do not leak into another project's context."""
+        default_web = AgentService(empty_project_dir).get_agent_context("claude")["has_native_web"]
+        config_service = ConfigService(initialized_project)
+        config = config_service.load_config()
+        config.agent_capabilities["claude"] = AgentCapabilitiesConfig(
+            has_native_web=not default_web
+        )
+        config_service.save_config(config)
+
+        overridden = AgentService(initialized_project).get_agent_context("claude")
+        assert overridden["has_native_web"] is (not default_web)
+        assert AgentService(empty_project_dir).get_agent_context("claude")["has_native_web"] is (
+            default_web
+        )
+
 
 class TestGetCapabilitiesConfig:
     """Tests for get_capabilities_config method."""
 
-    def test_get_capabilities_config_returns_dict(self, initialized_project: Path) -> None:
+    def test_get_capabilities_config_returns_independent_copies(
+        self, agent_service: AgentService
+    ) -> None:
+        """Test mutating a returned capabilities dict does not affect later calls."""
+        caps = agent_service.get_capabilities_config("claude")
+        caps["has_mcp"] = "mutated"
+        assert agent_service.get_capabilities_config("Claude")["has_mcp"] != "mutated"
+
+    def test_get_capabilities_config_returns_dict(self, agent_service: AgentService) -> None:
         """Test get_capabilities_config returns a dictionary."""
-        service = AgentService(initialized_project)
-        caps = service.get_capabilities_config("claude")
+        caps = agent_service.get_capabilities_config("claude")
 
         assert isinstance(caps, dict)
 
-    def test_get_capabilities_config_has_expected_keys(self, initialized_project: Path) -> None:
+    def test_get_capabilities_config_has_expected_keys(self, agent_service: AgentService) -> None:
         """Test capabilities dict has expected keys."""
-        service = AgentService(initialized_project)
-        caps = service.get_capabilities_config("claude")
+        caps = agent_service.get_capabilities_config("claude")
 
         expected_keys = ["has_background_agents", "has_native_web", "has_mcp", "research_strategy"]
         for key in expected_keys:
             assert key in caps
 
     def test_get_capabilities_config_values_are_correct_types(
-        self, initialized_project: Path
+        self, agent_service: AgentService
     ) -> None:
         """Test capability values are correct types."""
-        service = AgentService(initialized_project)
-        caps = service.get_capabilities_config("claude")
+        caps = agent_service.get_capabilities_config("claude")
 
         # Boolean flags
         assert isinstance(caps["has_background_agents"], bool)
@@ -703,12 +941,11 @@ class TestGetCapabilitiesConfig:
         # String or None
         assert caps["research_strategy"] is None or isinstance(caps["research_strategy"], str)
 
-    def test_get_capabilities_config_different_agents(self, initialized_project: Path) -> None:
+    def test_get_capabilities_config_different_agents(self, agent_service: AgentService) -> None:
         """Test different agents have different capabilities."""
-        service = AgentService(initialized_project)
 
-        claude_caps = service.get_capabilities_config("claude")
-        copilot_caps = service.get_capabilities_config("copilot")
+        claude_caps = agent_service.get_capabilities_config("claude")
+        copilot_caps = agent_service.get_capabilities_config("copilot")
 
         # Both should have the same keys but may have different values
         assert set(claude_caps.keys()) == set(copilot_caps.keys())
@@ -719,8 +956,6 @@ class TestAgentCapabilitiesConfig:
 
     def test_capabilities_config_defaults_to_none(self) -> None:
         """Test that config fields default to None."""
-        from open_agent_kit.models.config import AgentCapabilitiesConfig
-
         config = AgentCapabilitiesConfig()
 
         assert config.has_background_agents is None
@@ -731,8 +966,6 @@ class TestAgentCapabilitiesConfig:
 
     def test_capabilities_config_accepts_values(self) -> None:
         """Test that config accepts explicit values."""
-        from open_agent_kit.models.config import AgentCapabilitiesConfig
-
         config = AgentCapabilitiesConfig(
             has_background_agents=True,
             has_native_web=False,
@@ -749,8 +982,6 @@ class TestAgentCapabilitiesConfig:
 
     def test_capabilities_config_in_oak_config(self, initialized_project: Path) -> None:
         """Test agent_capabilities can be set in OakConfig."""
-        from open_agent_kit.models.config import AgentCapabilitiesConfig
-
         config_service = ConfigService(initialized_project)
         config = config_service.load_config()
 
@@ -767,8 +998,6 @@ class TestAgentCapabilitiesConfig:
 
     def test_capabilities_config_persists_through_yaml(self, initialized_project: Path) -> None:
         """Test capabilities survive YAML serialization round-trip."""
-        from open_agent_kit.models.config import AgentCapabilitiesConfig
-
         config_service = ConfigService(initialized_project)
         config = config_service.load_config()
 
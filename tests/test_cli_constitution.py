@@ -7,32 +7,77 @@ import pytest
 from typer.testing import CliRunner
 
 from open_agent_kit.cli import app
+from open_agent_kit.commands.constitution_cmd import (
+    add_amendment,
+    create_file,
+    gather_agent_files_data,
+    gather_validation_data,
+    generate_agent_files,
+    generate_agent_files_data,
+)
 from open_agent_kit.config.paths import CONSTITUTION_FILENAME
+from open_agent_kit.services.constitution_service import ConstitutionService
+from open_agent_kit.services.validation_service import ValidationService
 
 # Default directory for test fixtures (matching config default)
 CONSTITUTION_DIR = "oak"
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Create CLI test runner."""
-    return CliRunner()
+def _create_constitution() -> None:
+    """Create a constitution through the create-file command without CLI dispatch."""
+    create_file(
+        project_name="Test",
+        author="Author",
+        tech_stack=None,
+        description=None,
+        context_file=None,
+        force=False,
+    )
+
+
+def _add_minor_amendment() -> None:
+    """Add a minor amendment through the add-amendment command without CLI dispatch."""
+    add_amendment(
+        summary="Test",
+        rationale="Test",
+        amendment_type="minor",
+        author="Author",
+        section=None,
+        impact=None,
+    )
+
+
+def _generate_agent_files() -> None:
+    """Generate agent files through the generate-agent-files command without CLI dispatch."""
+    generate_agent_files(json_output=False)
 
 
 @pytest.fixture
-def initialized_project_with_agent(temp_project_dir: Path) -> Path:
-    """Create a temporary project with .oak initialized and claude agent.
+def constitution_created(initialized_project: Path) -> Path:
+    """Create the baseline constitution in an initialized project.
 
     Args:
-        temp_project_dir: Temporary project directory
+        initialized_project: Initialized temporary project directory
 
     Returns:
-        Path to initialized project with agent
+        Path to the project with a constitution
     """
-    from open_agent_kit.commands.init_cmd import init_command
+    _create_constitution()
+    return initialized_project
 
-    init_command(force=False, agent=["claude"], no_interactive=True)
-    return temp_project_dir
+
+@pytest.fixture
+def constitution_created_with_agent(initialized_project_with_agent: Path) -> Path:
+    """Create the baseline constitution in a project with the claude agent.
+
+    Args:
+        initialized_project_with_agent: Initialized project with claude agent
+
+    Returns:
+        Path to the project with a constitution
+    """
+    _create_constitution()
+    return initialized_project_with_agent
 
 
 def test_constitution_create_file_basic(cli_runner: CliRunner, initialized_project: Path) -> None:
@@ -51,9 +96,8 @@ def test_constitution_create_file_basic(cli_runner: CliRunner, initialized_proje
     assert result.exit_code == 0
     constitution_path = initialized_project / CONSTITUTION_DIR / CONSTITUTION_FILENAME
     assert constitution_path.exists()
-    # Normalize paths for Windows comparison (resolves short paths)
-    expected_path = str(constitution_path.resolve())
-    assert expected_path in result.stdout or str(constitution_path) in result.stdout
+    # tmp_path is already resolved (symlinks, Windows short names), so no resolve() here
+    assert str(constitution_path) in result.stdout
 
 
 def test_constitution_create_file_with_optional_fields(
@@ -84,12 +128,9 @@ def test_constitution_create_file_with_optional_fields(
 
 
 def test_constitution_create_file_already_exists(
-    cli_runner: CliRunner, initialized_project: Path
+    cli_runner: CliRunner, constitution_created: Path
 ) -> None:
     """Test that creating constitution when it exists fails."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(
         app, ["constitution", "create-file", "--project-name", "Test2", "--author", "Author2"]
     )
@@ -97,11 +138,8 @@ def test_constitution_create_file_already_exists(
     assert "already exists" in result.stdout.lower()
 
 
-def test_constitution_get_content(cli_runner: CliRunner, initialized_project: Path) -> None:
+def test_constitution_get_content(cli_runner: CliRunner, constitution_created: Path) -> None:
     """Test getting constitution content."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(app, ["constitution", "get-content"])
     assert result.exit_code == 0
     assert "# Test Engineering Constitution" in result.stdout
@@ -118,22 +156,16 @@ def test_constitution_get_content_not_exists(
     assert "not found" in result.stdout.lower()
 
 
-def test_constitution_validate_valid(cli_runner: CliRunner, initialized_project: Path) -> None:
+def test_constitution_validate_valid(cli_runner: CliRunner, constitution_created: Path) -> None:
     """Test validating constitution command works."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(app, ["constitution", "validate"])
     assert "issues" in result.stdout.lower() or "valid" in result.stdout.lower()
 
 
 def test_constitution_validate_json_output(
-    cli_runner: CliRunner, initialized_project: Path
+    cli_runner: CliRunner, constitution_created: Path
 ) -> None:
     """Test validation with JSON output."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(app, ["constitution", "validate", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -150,11 +182,8 @@ def test_constitution_validate_not_exists(cli_runner: CliRunner, initialized_pro
     assert "not found" in result.stdout.lower()
 
 
-def test_constitution_get_version(cli_runner: CliRunner, initialized_project: Path) -> None:
+def test_constitution_get_version(cli_runner: CliRunner, constitution_created: Path) -> None:
     """Test getting constitution version."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(app, ["constitution", "get-version"])
     assert result.exit_code == 0
     assert "1.0.0" in result.stdout
@@ -168,37 +197,40 @@ def test_constitution_get_version_not_exists(
     assert result.exit_code != 0
 
 
-def test_constitution_add_amendment_minor(cli_runner: CliRunner, initialized_project: Path) -> None:
-    """Test adding a minor amendment."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
+@pytest.mark.parametrize(
+    ("amendment_type", "expected_version"),
+    [("minor", "1.1.0"), ("major", "2.0.0"), ("patch", "1.0.1")],
+)
+def test_constitution_add_amendment_bumps_version(
+    cli_runner: CliRunner,
+    constitution_created: Path,
+    amendment_type: str,
+    expected_version: str,
+) -> None:
+    """Test each amendment type bumps the matching version component."""
     result = cli_runner.invoke(
         app,
         [
             "constitution",
             "add-amendment",
             "--summary",
-            "Add security requirements",
+            "Update requirements",
             "--rationale",
-            "Security audit found gaps",
+            "Standards changed",
             "--type",
-            "minor",
+            amendment_type,
             "--author",
-            "Security Team",
+            "Lead",
         ],
     )
     assert result.exit_code == 0
-    assert "1.1.0" in result.stdout
+    assert expected_version in result.stdout
 
 
 def test_constitution_add_amendment_with_optional_fields(
-    cli_runner: CliRunner, initialized_project: Path
+    cli_runner: CliRunner, constitution_created: Path
 ) -> None:
     """Test adding amendment with optional fields."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(
         app,
         [
@@ -219,68 +251,17 @@ def test_constitution_add_amendment_with_optional_fields(
         ],
     )
     assert result.exit_code == 0
-    constitution_path = initialized_project / CONSTITUTION_DIR / CONSTITUTION_FILENAME
+    constitution_path = constitution_created / CONSTITUTION_DIR / CONSTITUTION_FILENAME
     content = constitution_path.read_text(encoding="utf-8")
     assert "Add testing requirements" in content
     assert "Testing" in content
     assert "Teams must write more tests" in content
 
 
-def test_constitution_add_amendment_major(cli_runner: CliRunner, initialized_project: Path) -> None:
-    """Test adding a major amendment."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
-    result = cli_runner.invoke(
-        app,
-        [
-            "constitution",
-            "add-amendment",
-            "--summary",
-            "Remove requirement",
-            "--rationale",
-            "No longer needed",
-            "--type",
-            "major",
-            "--author",
-            "Lead",
-        ],
-    )
-    assert result.exit_code == 0
-    assert "2.0.0" in result.stdout
-
-
-def test_constitution_add_amendment_patch(cli_runner: CliRunner, initialized_project: Path) -> None:
-    """Test adding a patch amendment."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
-    result = cli_runner.invoke(
-        app,
-        [
-            "constitution",
-            "add-amendment",
-            "--summary",
-            "Clarify wording",
-            "--rationale",
-            "Ambiguous",
-            "--type",
-            "patch",
-            "--author",
-            "Editor",
-        ],
-    )
-    assert result.exit_code == 0
-    assert "1.0.1" in result.stdout
-
-
 def test_constitution_add_amendment_invalid_type(
-    cli_runner: CliRunner, initialized_project: Path
+    cli_runner: CliRunner, constitution_created: Path
 ) -> None:
     """Test adding amendment with invalid type fails."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(
         app,
         [
@@ -337,38 +318,26 @@ def test_constitution_list_agent_files_json(
     assert "copilot" in output
 
 
-def test_constitution_list_agent_files_no_agents(
-    cli_runner: CliRunner, initialized_project: Path
-) -> None:
+def test_constitution_list_agent_files_no_agents(initialized_project: Path) -> None:
     """Test listing agent files when no agents detected."""
-    result = cli_runner.invoke(app, ["constitution", "list-agent-files", "--json"])
-    assert result.exit_code == 0
-    output = json.loads(result.stdout)
-    assert isinstance(output, dict)
-    assert len(output) == 0
+    assert gather_agent_files_data(initialized_project) == {}
 
 
 def test_constitution_generate_agent_files(
-    cli_runner: CliRunner, initialized_project_with_agent: Path
+    cli_runner: CliRunner, constitution_created_with_agent: Path
 ) -> None:
     """Test generating agent instruction files."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(app, ["constitution", "generate-agent-files"])
     assert result.exit_code == 0
     assert "claude" in result.stdout.lower()
-    agent_file = initialized_project_with_agent / "CLAUDE.md"
+    agent_file = constitution_created_with_agent / "CLAUDE.md"
     assert agent_file.exists()
 
 
 def test_constitution_generate_agent_files_json_output(
-    cli_runner: CliRunner, initialized_project_with_agent: Path
+    cli_runner: CliRunner, constitution_created_with_agent: Path
 ) -> None:
     """Test generating agent files with JSON output."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
     result = cli_runner.invoke(app, ["constitution", "generate-agent-files", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -386,48 +355,28 @@ def test_constitution_generate_agent_files_not_exists(
 
 
 def test_constitution_update_agent_files(
-    cli_runner: CliRunner, initialized_project_with_agent: Path
+    cli_runner: CliRunner, constitution_created_with_agent: Path
 ) -> None:
     """Test updating agent instruction files."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
-    cli_runner.invoke(app, ["constitution", "generate-agent-files"])
-    cli_runner.invoke(
-        app,
-        [
-            "constitution",
-            "add-amendment",
-            "--summary",
-            "Test",
-            "--rationale",
-            "Test",
-            "--type",
-            "minor",
-            "--author",
-            "Author",
-        ],
-    )
+    _generate_agent_files()
+    _add_minor_amendment()
     result = cli_runner.invoke(app, ["constitution", "update-agent-files"])
     assert result.exit_code == 0
     assert "claude" in result.stdout.lower()
-    agent_file = initialized_project_with_agent / "CLAUDE.md"
+    agent_file = constitution_created_with_agent / "CLAUDE.md"
     assert agent_file.exists()
     content = agent_file.read_text(encoding="utf-8")
     assert "constitution" in content.lower()
-    cli_runner.invoke(app, ["constitution", "generate-agent-files"])
+    _generate_agent_files()
     content = agent_file.read_text(encoding="utf-8")
     assert "1.1.0" in content
 
 
 def test_constitution_update_agent_files_json_output(
-    cli_runner: CliRunner, initialized_project_with_agent: Path
+    cli_runner: CliRunner, constitution_created_with_agent: Path
 ) -> None:
     """Test updating agent files with JSON output."""
-    cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
-    cli_runner.invoke(app, ["constitution", "generate-agent-files"])
+    _generate_agent_files()
     result = cli_runner.invoke(app, ["constitution", "update-agent-files", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -445,37 +394,35 @@ def test_constitution_update_agent_files_not_exists(
 
 
 def test_constitution_commands_work_in_sequence(
-    cli_runner: CliRunner, initialized_project: Path
+    cli_runner: CliRunner, constitution_created: Path
 ) -> None:
     """Test that constitution commands work correctly in sequence."""
-    result = cli_runner.invoke(
-        app, ["constitution", "create-file", "--project-name", "Test", "--author", "Author"]
-    )
-    assert result.exit_code == 0
     result = cli_runner.invoke(app, ["constitution", "get-version"])
     assert result.exit_code == 0
     assert "1.0.0" in result.stdout
     result = cli_runner.invoke(app, ["constitution", "validate"])
     assert "issues" in result.stdout.lower() or "valid" in result.stdout.lower()
-    result = cli_runner.invoke(
-        app,
-        [
-            "constitution",
-            "add-amendment",
-            "--summary",
-            "Test",
-            "--rationale",
-            "Test",
-            "--type",
-            "minor",
-            "--author",
-            "Author",
-        ],
-    )
-    assert result.exit_code == 0
+    _add_minor_amendment()
     result = cli_runner.invoke(app, ["constitution", "get-version"])
     assert result.exit_code == 0
     assert "1.1.0" in result.stdout
     result = cli_runner.invoke(app, ["constitution", "get-content"])
     assert result.exit_code == 0
     assert "Amendment 1.1.0" in result.stdout
+
+
+def test_gather_validation_data_summarizes_result(constitution_created: Path) -> None:
+    """Test the validate report is built from the result without CLI serialization."""
+    constitution = ConstitutionService.from_config(constitution_created).load()
+    result = ValidationService.from_config().validate(constitution)
+    output = gather_validation_data(result)
+    assert output["is_valid"] is result.is_valid
+    assert len(output["issues"]) == len(result.issues)
+    assert output["summary"]["total_issues"] == result.total_issues
+    assert json.loads(json.dumps(output)) == output
+
+
+def test_generate_agent_files_data_returns_paths(constitution_created_with_agent: Path) -> None:
+    """Test generated agent files are reported as string paths."""
+    generated = generate_agent_files_data(constitution_created_with_agent)
+    assert Path(generated["claude"]) == constitution_created_with_agent / "CLAUDE.md"
@@ -0,0 +1,96 @@
+"""Tests for ConfigService loading and caching."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from open_agent_kit.models.config import AgentCapabilitiesConfig, OakConfig
+from open_agent_kit.services.config_service import ConfigService
+
+
+class TestLoadConfigCache:
+    """Tests for reuse of parsed config across load_config calls."""
+
+    def test_unchanged_file_skips_parse(self, tmp_path: Path) -> None:
+        """Test a second load of the same bytes does not parse YAML again."""
+        service = ConfigService(tmp_path)
+        service.create_default_config(agents=["claude"])
+        first = service.load_config()
+        with patch.object(OakConfig, "from_dict", side_effect=AssertionError("re-parsed")):
+            second = ConfigService(tmp_path).load_config()
+        assert second == first
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Test mutating a loaded config does not leak into later loads."""
+        service = ConfigService(tmp_path)
+        service.create_default_config(agents=["claude"])
+        service.load_config().agents.append("copilot")
+        assert service.load_config().agents == ["claude"]
+
+    def test_external_edit_is_reloaded(self, tmp_path: Path) -> None:
+        """Test a file changed outside the service is parsed again."""
+        service = ConfigService(tmp_path)
+        service.create_default_config(agents=["claude"])
+        assert service.load_config().agents == ["claude"]
+        content = service.config_path.read_text(encoding="utf-8")
+        service.config_path.write_text(
+            content.replace("agents: [claude]", "agents: [gemini]"), encoding="utf-8"
+        )
+        assert service.load_config().agents == ["gemini"]
+
+    def test_save_replaces_cached_config(self, tmp_path: Path) -> None:
+        """Test a saved config is what the next load returns."""
+        service = ConfigService(tmp_path)
+        service.create_default_config(agents=["claude"])
+        config = service.load_config()
+        config.agents = ["codex"]
+        service.save_config(config)
+        assert service.load_config().agents == ["codex"]
+
+    def test_config_without_features_is_not_cached(self, tmp_path: Path) -> None:
+        """Test configs whose features are inferred from commands are parsed each time."""
+        service = ConfigService(tmp_path)
+        service.config_path.parent.mkdir(parents=True)
+        service.config_path.write_text("agents: [claude]\n", encoding="utf-8")
+        service.load_config()
+        with patch.object(OakConfig, "from_dict", wraps=OakConfig.from_dict) as from_dict:
+            service.load_config()
+        from_dict.assert_called_once()
+
+    def test_miss_parses_file_once(self, tmp_path: Path) -> None:
+        """Test a cache miss parses config.yaml once for the migration check and model."""
+        service = ConfigService(tmp_path)
+        service.create_default_config(agents=["claude"])
+        with patch("yaml.load", wraps=yaml.load) as yaml_load:
+            service.load_config()
+        yaml_load.assert_called_once()
+
+
+class TestConfigYamlRoundTrip:
+    """Tests for config serialization through the libyaml-backed loader and dumper."""
+
+    def test_save_then_load_preserves_config(self, tmp_path: Path) -> None:
+        """Test a saved config with long and non-ASCII values loads back unchanged."""
+        config = OakConfig(agents=["claude", "copilot", "cursor", "codex"], ides=["vscode"])
+        config.agent_capabilities["claude"] = AgentCapabilitiesConfig(has_background_agents=False)
+        config.rfc.directory = "docs/rfc/" + "ünïcode-—-" * 12
+        config_path = tmp_path / "config.yaml"
+        config.save(config_path)
+        assert OakConfig.load(config_path) == config
+
+
+class TestInitializedProjectIsolation:
+    """Tests that per-test projects do not share files with the session template."""
+
+    def test_save_config_leaves_template_untouched(
+        self, initialized_project: Path, initialized_project_template: Path
+    ) -> None:
+        """Test saving config in a test project does not alter the template copy."""
+        template_config = initialized_project_template / ".oak" / "config.yaml"
+        before = template_config.read_bytes()
+        service = ConfigService(initialized_project)
+        config = service.load_config()
+        config.agents = ["codex"]
+        service.save_config(config)
+        assert template_config.read_bytes() == before
@@ -1,5 +1,6 @@
 """Comprehensive tests for console utility functions."""
 
+import importlib.util
 from collections.abc import Generator
 from unittest.mock import MagicMock, Mock, patch
 
@@ -71,6 +72,24 @@ class TestConsoleInstance:
         for style in required_styles:
             assert style in custom_theme.styles
 
+    def test_theme_is_built_on_first_use(self) -> None:
+        """Test importing the module does not build the theme until it is requested."""
+        spec = importlib.util.find_spec("open_agent_kit.utils.console")
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert module._theme is None
+        theme = module.custom_theme
+        assert module._theme is theme
+        assert module.custom_theme is theme
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test the lazy module attribute hook only provides custom_theme."""
+        import open_agent_kit.utils.console as console_module
+
+        with pytest.raises(AttributeError):
+            _ = console_module.missing_attribute
+
 
 # ============================================================================
 # Print Message Functions Tests
@@ -321,6 +340,23 @@ class TestPanelAndTable:
         assert isinstance(table, Table)
         # Should have 2 rows despite missing value
         assert len(table.rows) == 2
+        age_cells = list(table.columns[1].cells)
+        assert age_cells == ["30", ""]
+
+    def test_print_table_empty_columns_adds_empty_rows(self, mock_console: MagicMock) -> None:
+        """Test print_table with an empty column list adds one empty row per item."""
+        data = [{"name": "Alice"}, {"name": "Bob"}]
+        print_table(data, columns=[])
+        table = mock_console.print.call_args[0][0]
+        assert len(table.columns) == 0
+        assert len(table.rows) == 2
+
+    def test_print_table_single_column_values(self, mock_console: MagicMock) -> None:
+        """Test print_table renders cell values for a single column."""
+        data = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+        print_table(data, columns=["age"])
+        table = mock_console.print.call_args[0][0]
+        assert list(table.columns[0].cells) == ["30", "25"]
 
 
 # ============================================================================
@@ -406,6 +442,13 @@ class TestListsAndFormatting:
         call_args = mock_console.print.call_args
         assert "error" in str(call_args)
 
+    def test_print_divider_explicit_width(self, mock_console: MagicMock) -> None:
+        """Test print_divider uses an explicit width instead of the console width."""
+        mock_console.width = 80
+        print_divider(width=10)
+        call_args = mock_console.print.call_args
+        assert call_args[0][0] == "─" * 10
+
     def test_print_step(self, mock_console: MagicMock) -> None:
         """Test print_step formats step indicator."""
         print_step(1, 5, "Initialize")
@@ -2,6 +2,7 @@
 
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -303,3 +304,35 @@ def test_constitution_status_changes_with_amendments(temp_project_dir: Path) ->
     service.add_amendment("Test", "Test", "minor", "Author")
     loaded = service.load()
     assert loaded.metadata.status == ConstitutionStatus.AMENDED
+
+
+def test_load_reuses_parse_for_unchanged_file(temp_project_dir: Path) -> None:
+    """Test loading an unchanged constitution again does not re-parse it."""
+    service = ConstitutionService(temp_project_dir)
+    service.create(project_name="Test Project", author="Author")
+    first = service.load()
+    with patch.object(
+        ConstitutionService, "_parse_constitution", side_effect=AssertionError("re-parsed")
+    ):
+        second = ConstitutionService(temp_project_dir).load()
+    assert second == first
+
+
+def test_load_returns_independent_copies(temp_project_dir: Path) -> None:
+    """Test mutating a loaded constitution does not leak into later loads."""
+    service = ConstitutionService(temp_project_dir)
+    service.create(project_name="Test Project", author="Author")
+    service.load().metadata.project_name = "Mutated"
+    assert service.load().metadata.project_name == "Test Project"
+
+
+def test_load_reparses_after_external_edit(temp_project_dir: Path) -> None:
+    """Test a constitution edited outside the service is parsed again."""
+    service = ConstitutionService(temp_project_dir)
+    service.create(project_name="Test Project", author="Author")
+    assert service.get_current_version() == "1.0.0"
+    service.add_amendment(summary="Change", rationale="Why", amendment_type="minor", author="A")
+    assert service.get_current_version() == "1.1.0"
+    path = service.get_constitution_path()
+    path.write_text(path.read_text(encoding="utf-8").replace("1.1.0", "1.2.0"), encoding="utf-8")
+    assert service.get_current_version() == "1.2.0"
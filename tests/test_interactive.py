@@ -38,6 +38,13 @@ class TestSelectOption:
         assert option.label == "myvalue"
         assert option.description is None
 
+    def test_select_option_uses_slots(self) -> None:
+        """Test SelectOption stores fields in slots rather than a per-instance dict."""
+        option = SelectOption("value", "Label")
+        assert not hasattr(option, "__dict__")
+        with pytest.raises(AttributeError):
+            option.extra = "nope"  # type: ignore[attr-defined]
+
     def test_select_option_repr(self) -> None:
         """Test SelectOption string representation."""
         option = SelectOption("val", "Label")
@@ -209,6 +216,26 @@ class TestSelect:
         # Verify console file operations were called (clearing and re-rendering)
         assert mock_console.file.write.called
 
+    def test_select_repaints_only_changed_rows(
+        self, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test select rewrites just the two affected rows and clears with one escape."""
+        options = [
+            SelectOption("opt1", "Option 1", "Description for option 1"),
+            SelectOption("opt2", "Option 2"),
+        ]
+        mock_readkey.side_effect = [readchar.key.DOWN, readchar.key.ENTER]
+
+        select(options)
+        writes = [c.args[0] for c in mock_console.file.write.call_args_list]
+        assert writes == [
+            "\033[3F\033[2K",  # Up to option 1 (above its description)
+            "\033[3E",
+            "\033[1F\033[2K",  # Up to option 2
+            "\033[1E",
+            "\033[3F\033[J",  # Clear the whole menu
+        ]
+
     def test_select_enter_immediately(self, mock_console: Mock, mock_readkey: Mock) -> None:
         """Test select with Enter immediately."""
         options = [
@@ -328,6 +355,34 @@ class TestMultiSelect:
         result = multi_select(options, defaults=["a", "c"])
         assert set(result) == {"a", "c"}
 
+    def test_multi_select_returns_selection_order(
+        self, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test multi_select returns values and labels in the order they were selected."""
+        options = [SelectOption("a", "A"), SelectOption("b", "B"), SelectOption("c", "C")]
+        # Select C (up wraps to last), then A
+        mock_readkey.side_effect = [
+            readchar.key.UP,
+            readchar.key.SPACE,
+            readchar.key.DOWN,
+            readchar.key.SPACE,
+            readchar.key.ENTER,
+        ]
+
+        result = multi_select(options, "Pick:")
+        assert result == ["c", "a"]
+        mock_console.print.assert_called_with("[cyan]?[/cyan] Pick: [green]C, A[/green]")
+
+    def test_multi_select_ignores_unknown_defaults(
+        self, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test multi_select drops defaults that are not among the options."""
+        options = [SelectOption("a", "A"), SelectOption("b", "B")]
+        mock_readkey.return_value = readchar.key.ENTER
+
+        result = multi_select(options, defaults=["b", "missing", "b"])
+        assert result == ["b"]
+
     def test_multi_select_min_selections_enforced(
         self, mock_console: Mock, mock_readkey: Mock
     ) -> None:
@@ -404,6 +459,29 @@ class TestMultiSelect:
         result = multi_select(options)
         assert result == ["c"]
 
+    def test_multi_select_space_repaints_row_and_count(
+        self, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test toggling an option rewrites only its row and the count line."""
+        options = [SelectOption("a", "A"), SelectOption("b", "B")]
+        mock_readkey.side_effect = [readchar.key.DOWN, readchar.key.SPACE, readchar.key.ENTER]
+
+        result = multi_select(options)
+        assert result == ["b"]
+        writes = [c.args[0] for c in mock_console.file.write.call_args_list]
+        # Menu is 4 lines: A, B, blank, count
+        assert writes == [
+            "\033[4F\033[2K",  # Navigation: row A
+            "\033[4E",
+            "\033[3F\033[2K",  # Navigation: row B
+            "\033[3E",
+            "\033[3F\033[2K",  # Space: row B
+            "\033[3E",
+            "\033[1F\033[2K",  # Space: count line
+            "\033[1E",
+            "\033[4F\033[J",  # Clear the whole menu
+        ]
+
     def test_multi_select_ctrl_c(self, mock_console: Mock, mock_readkey: Mock) -> None:
         """Test multi_select raises KeyboardInterrupt on Ctrl+C."""
         options = [SelectOption("a", "A")]
@@ -924,6 +1002,54 @@ class TestSelectWithSearch:
         result = select_with_search(options)
         assert result == "Apple"
 
+    @patch("sys.stdout")
+    def test_select_with_search_navigation_repaints_rows(
+        self, mock_stdout: Mock, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test arrow keys rewrite only the affected rows instead of redrawing."""
+        options = ["first", "second", "third"]
+        mock_readkey.side_effect = [readchar.key.DOWN, readchar.key.UP, readchar.key.ENTER]
+
+        select_with_search(options)
+        writes = [c.args[0] for c in mock_console.file.write.call_args_list]
+        assert writes == [
+            "Search: type to filter...\n  ❯ first\n    second\n    third\n",
+            "\033[3F\033[2K    first\033[3E",  # Up to "first" (below the search line)
+            "\033[2F\033[2K  ❯ second\033[2E",
+            "\033[2F\033[2K    second\033[2E",
+            "\033[3F\033[2K  ❯ first\033[3E",
+            "\033[4F\033[J",  # Clear the whole menu
+        ]
+
+    @patch("sys.stdout")
+    def test_select_with_search_frame_styles(
+        self, mock_stdout: Mock, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test select_with_search writes ANSI-styled frames on color consoles."""
+        mock_console.color_system = "truecolor"
+        mock_console.no_color = False
+        mock_readkey.return_value = readchar.key.ENTER
+
+        select_with_search(["first", "second"])
+        frame = mock_console.file.write.call_args_list[0].args[0]
+        assert frame == (
+            "Search: \033[2mtype to filter...\033[0m\n"
+            "\033[1;36m  ❯ first\033[0m\n"
+            "\033[2m    second\033[0m\n"
+        )
+
+    @patch("sys.stdout")
+    def test_select_with_search_navigation_keeps_filter(
+        self, mock_stdout: Mock, mock_console: Mock, mock_readkey: Mock
+    ) -> None:
+        """Test arrow keys navigate within the filtered options."""
+        options = ["Alpha", "beta", "Bravo", "charlie"]
+        # Type uppercase 'B', Down, Enter
+        mock_readkey.side_effect = ["B", readchar.key.DOWN, readchar.key.ENTER]
+
+        result = select_with_search(options)
+        assert result == "Bravo"
+
     @patch("sys.stdout")
     def test_select_with_search_searches_value_and_label(
         self, mock_stdout: Mock, mock_console: Mock, mock_readkey: Mock
@@ -949,8 +1075,9 @@ class TestSelectWithSearch:
 
         result = select_with_search(options)
         assert result == "option0"
-        # Verify "... and X more" message would be shown
-        # (console.print should be called for the ellipsis)
+        frame = mock_console.file.write.call_args_list[0].args[0]
+        assert frame.count("option") == 10
+        assert frame.endswith("\n\n... and 10 more\n")
 
     @patch("sys.stdout")
     def test_select_with_search_printable_characters(
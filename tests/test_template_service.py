@@ -137,6 +137,45 @@ class TestEnvironmentSetup:
         assert service.env.lstrip_blocks is True
 
 
+class TestEnvironmentSharing:
+    """Test reuse of compiled templates across TemplateService instances."""
+
+    def test_services_share_compiled_templates(self, tmp_path: Path) -> None:
+        """Test services using the package templates reuse the compiled template."""
+        first = TemplateService(project_root=tmp_path)
+        second = TemplateService(project_root=tmp_path)
+        assert first.env is second.env
+
+    def test_custom_templates_dir_gets_fresh_environment(self, tmp_path: Path) -> None:
+        """Test services with a custom templates directory do not share an environment."""
+        custom_dir = tmp_path / "custom_templates"
+        custom_dir.mkdir()
+        first = TemplateService(templates_dir=custom_dir, project_root=tmp_path)
+        second = TemplateService(templates_dir=custom_dir, project_root=tmp_path)
+        assert first.env is not second.env
+        assert first.env is not TemplateService(project_root=tmp_path).env
+
+    def test_edited_template_is_recompiled(self, tmp_path: Path) -> None:
+        """Test a new service picks up changes to a custom template file."""
+        custom_dir = tmp_path / "custom_templates"
+        custom_dir.mkdir()
+        template_file = custom_dir / "edited.md"
+        template_file.write_text("before", encoding="utf-8")
+        assert TemplateService(templates_dir=custom_dir).render_template("edited.md") == "before"
+        template_file.write_text("after", encoding="utf-8")
+        assert TemplateService(templates_dir=custom_dir).render_template("edited.md") == "after"
+
+    def test_different_search_paths_get_separate_environments(self, tmp_path: Path) -> None:
+        """Test services with different template directories do not share templates."""
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        for directory, text in ((first_dir, "first"), (second_dir, "second")):
+            directory.mkdir()
+            (directory / "page.md").write_text(text, encoding="utf-8")
+        assert TemplateService(templates_dir=first_dir).render_template("page.md") == "first"
+        assert TemplateService(templates_dir=second_dir).render_template("page.md") == "second"
+
+
 class TestRenderString:
     """Test render_string method."""
 
@@ -76,33 +76,27 @@ def test_files_differ_nonexistent_file(initialized_project: Path) -> None:
     assert not service._files_differ(file1, file2)
 
 
-def test_plan_upgrade_detects_modified_command(initialized_project: Path) -> None:
+def test_plan_upgrade_detects_modified_command(initialized_project_with_agent: Path) -> None:
     """Test that plan_upgrade detects modified agent command files."""
-    from open_agent_kit.commands.init_cmd import init_command
-
-    init_command(force=False, agent=["claude"], no_interactive=True)
-    commands_dir = initialized_project / ".claude" / "commands"
+    commands_dir = initialized_project_with_agent / ".claude" / "commands"
     command_file = commands_dir / "oak.rfc-create.md"
     assert command_file.exists()
     original_content = command_file.read_text(encoding="utf-8")
     command_file.write_text(original_content + "\n# Modified\n", encoding="utf-8")
-    service = UpgradeService(initialized_project)
+    service = UpgradeService(initialized_project_with_agent)
     plan = service.plan_upgrade(commands=True, templates=False)
     assert len(plan["commands"]) > 0
     assert any(cmd["file"] == "oak.rfc-create.md" for cmd in plan["commands"])
 
 
-def test_execute_upgrade_restores_command(initialized_project: Path) -> None:
+def test_execute_upgrade_restores_command(initialized_project_with_agent: Path) -> None:
     """Test that execute_upgrade restores modified command file."""
-    from open_agent_kit.commands.init_cmd import init_command
-
-    init_command(force=False, agent=["claude"], no_interactive=True)
-    commands_dir = initialized_project / ".claude" / "commands"
+    commands_dir = initialized_project_with_agent / ".claude" / "commands"
     command_file = commands_dir / "oak.rfc-create.md"
     original_content = command_file.read_text(encoding="utf-8")
     modified_content = original_content + "\n# Modified\n"
     command_file.write_text(modified_content, encoding="utf-8")
-    service = UpgradeService(initialized_project)
+    service = UpgradeService(initialized_project_with_agent)
     plan = service.plan_upgrade(commands=True, templates=False)
     results = service.execute_upgrade(plan)
     assert len(results["commands"]["upgraded"]) > 0
@@ -175,22 +169,20 @@ def test_upgrade_service_with_custom_project_root(temp_project_dir: Path) -> Non
     assert service.project_root == temp_project_dir
 
 
-def test_execute_upgrade_updates_config_version(initialized_project: Path) -> None:
+def test_execute_upgrade_updates_config_version(initialized_project_with_agent: Path) -> None:
     """Test that execute_upgrade updates the config version."""
     from open_agent_kit import __version__
-    from open_agent_kit.commands.init_cmd import init_command
     from open_agent_kit.services.config_service import ConfigService
 
-    init_command(force=False, agent=["claude"], no_interactive=True)
-    config_service = ConfigService(initialized_project)
+    config_service = ConfigService(initialized_project_with_agent)
     config = config_service.load_config()
     config.version = "0.0.1"
     config_service.save_config(config)
-    commands_dir = initialized_project / ".claude" / "commands"
+    commands_dir = initialized_project_with_agent / ".claude" / "commands"
     command_file = commands_dir / "oak.rfc-create.md"
     original_content = command_file.read_text(encoding="utf-8")
     command_file.write_text(original_content + "\n# Modified\n", encoding="utf-8")
-    service = UpgradeService(initialized_project)
+    service = UpgradeService(initialized_project_with_agent)
     plan = service.plan_upgrade(commands=True, templates=False)
     results = service.execute_upgrade(plan)
     assert results["version_updated"] is True
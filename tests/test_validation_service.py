@@ -12,7 +12,12 @@ from open_agent_kit.models.constitution import (
     ConstitutionSection,
     ConstitutionStatus,
 )
-from open_agent_kit.models.validation import ValidationCategory, ValidationPriority
+from open_agent_kit.models.validation import (
+    ValidationCategory,
+    ValidationIssue,
+    ValidationPriority,
+    ValidationResult,
+)
 from open_agent_kit.services.validation_service import ValidationService
 
 
@@ -323,6 +328,7 @@ def test_validation_from_config() -> None:
     """Test creating validation service from config."""
     service = ValidationService.from_config()
     assert isinstance(service, ValidationService)
+    assert ValidationService.from_config() is service
 
 
 def test_validation_multiple_missing_sections() -> None:
@@ -442,6 +448,21 @@ def test_quality_flags_missing_normative_language(valid_constitution: Constituti
     assert any("normative" in issue.message.lower() for issue in quality_issues)
 
 
+def test_quality_normative_keywords_match_whole_words(
+    valid_constitution: ConstitutionDocument,
+) -> None:
+    """Normative keywords embedded in other words do not count as normative language."""
+    governance_section = valid_constitution.get_section("Governance")
+    assert governance_section is not None
+    governance_section.content = "Mayors review proposals. Maybe the council meets on Tuesdays."
+    service = ValidationService()
+    result = service.validate(valid_constitution)
+    quality_issues = [
+        issue for issue in result.issues if issue.category == ValidationCategory.QUALITY
+    ]
+    assert any("normative" in issue.message.lower() for issue in quality_issues)
+
+
 def test_quality_flags_vague_language(valid_constitution: ConstitutionDocument) -> None:
     """Quality assessment flags vague commitments."""
     principles_section = valid_constitution.get_section("Principles")
@@ -486,3 +507,48 @@ def test_consistency_flags_unsorted_amendments(valid_constitution: ConstitutionD
     ]
     assert any("chronological" in issue.message.lower() for issue in consistency_issues)
     assert any("monotonically" in issue.message.lower() for issue in consistency_issues)
+
+
+def test_count_substantive_sentences_stops_at_limit() -> None:
+    """Sentence counting stops early once the requested limit is reached."""
+    content = "- one\n- two\n- three\n- four"
+    assert ValidationService._count_substantive_sentences(content) == 4
+    assert ValidationService._count_substantive_sentences(content, limit=2) == 2
+    prose = "First rule. Second rule. Third rule."
+    assert ValidationService._count_substantive_sentences(prose) == 3
+    assert ValidationService._count_substantive_sentences(prose, limit=2) == 2
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        ("1.2.3", (1, 2, 3)),
+        ("10.0.01", (10, 0, 1)),
+        ("1.0", None),
+        ("1.0.0-beta", None),
+        ("v1.0.0", None),
+        ("", None),
+    ],
+)
+def test_parse_version(version: str, expected: tuple[int, int, int] | None) -> None:
+    """Semantic versions parse into integer tuples; anything else yields None."""
+    assert ValidationService._parse_version(version) == expected
+
+
+def test_result_extend_issues() -> None:
+    """Batch-added issues mark the result invalid; an empty batch leaves it valid."""
+    result = ValidationResult(is_valid=True)
+    result.extend_issues([])
+    assert result.is_valid
+
+    issues = [
+        ValidationIssue(
+            category=ValidationCategory.LANGUAGE,
+            priority=ValidationPriority.LOW,
+            message=f"Issue {index}",
+        )
+        for index in range(3)
+    ]
+    result.extend_issues(issues)
+    assert not result.is_valid
+    assert result.issues == issues
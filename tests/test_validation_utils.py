@@ -0,0 +1,145 @@
+"""Tests for input validation utility functions."""
+
+from unittest.mock import patch
+
+import pytest
+
+from open_agent_kit.utils.validation import (
+    _available_agents,
+    parse_rfc_filename,
+    parse_rfc_number,
+    sanitize_title,
+    validate_agent_type,
+    validate_email,
+    validate_markdown_syntax,
+    validate_rfc_content,
+    validate_rfc_filename,
+    validate_rfc_number,
+    validate_rfc_status,
+    validate_url,
+    validate_version,
+)
+
+
+@pytest.mark.parametrize(
+    ("rfc_input", "expected"),
+    [
+        ("001", "001"),
+        ("RFC-001", "001"),
+        ("rfc_0042", "0042"),
+        (" RFC 2024-001 ", "2024-001"),
+        ("RFC-1", None),
+        ("abc", None),
+    ],
+)
+def test_parse_rfc_number(rfc_input: str, expected: str | None) -> None:
+    """Test RFC number normalization across input formats."""
+    assert parse_rfc_number(rfc_input) == expected
+
+
+def test_validate_rfc_number() -> None:
+    """Test RFC number format validation."""
+    assert validate_rfc_number("001")
+    assert validate_rfc_number("2024-001")
+    assert not validate_rfc_number("01")
+
+
+def test_rfc_filename_validation_and_parsing() -> None:
+    """Test RFC filename validation and parsing."""
+    assert validate_rfc_filename("RFC-001-Add-User-Auth.md")
+    assert not validate_rfc_filename("001-Add-User-Auth.md")
+    assert parse_rfc_filename("RFC-001-Add-User-Auth.md") == ("001", "Add-User-Auth")
+    assert parse_rfc_filename("notes.md") is None
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [("draft", True), ("Adopted", True), ("REVIEW", True), ("pending", False)],
+)
+def test_validate_rfc_status(status: str, expected: bool) -> None:
+    """Test RFC status validation is case-insensitive."""
+    assert validate_rfc_status(status) is expected
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Add User Auth", "Add-User-Auth"),
+        ('What: "new" <API>?', "What-new-API"),
+        ("  spaced  --  out  ", "spaced-out"),
+        ("a/b\\c|d*e", "abcde"),
+    ],
+)
+def test_sanitize_title(title: str, expected: str) -> None:
+    """Test title sanitization for filenames."""
+    assert sanitize_title(title) == expected
+
+
+def test_validate_email_url_and_version() -> None:
+    """Test email, URL, and semantic version format validation."""
+    assert validate_email("dev@example.com")
+    assert not validate_email("dev@example")
+    assert validate_url("https://example.com/path?q=1")
+    assert validate_url("http://localhost:8080")
+    assert not validate_url("ftp://example.com")
+    assert validate_version("1.2.3-rc.1+build.5")
+    assert not validate_version("1.2")
+
+
+def test_validate_markdown_syntax_reports_issues_in_line_order() -> None:
+    """Test markdown checks report per-line issues in document order."""
+    content = "# Title\n### Skipped \n[link]()\n```python\nprint()\n"
+
+    is_valid, issues = validate_markdown_syntax(content)
+
+    assert not is_valid
+    assert issues == [
+        "Line 2: Header level skipped from 1 to 3",
+        "Line 2: Trailing whitespace",
+        "Line 3: Empty link found",
+        "Unclosed code block",
+    ]
+
+
+def test_validate_markdown_syntax_clean_content() -> None:
+    """Test well-formed markdown passes validation."""
+    content = "# Title\n\n## Section\n\n```\n# not a header skip\n```\n"
+
+    assert validate_markdown_syntax(content) == (True, [])
+
+
+def test_validate_rfc_content_heading_matching() -> None:
+    """Test required RFC sections are matched on whole heading lines."""
+    content = "\n".join(
+        [
+            "# Summary  ",
+            "  ## Motivation",
+            "# # Detailed Design",
+            "### Drawbacks",
+            "## Alternatives considered",
+            "##  Unresolved Questions",
+        ]
+    )
+
+    is_valid, missing = validate_rfc_content(content)
+
+    assert missing == ["## Drawbacks", "## Alternatives", "## Unresolved Questions"]
+    assert not is_valid
+    assert validate_rfc_content(content.replace("###", "##"))[0]
+
+
+def test_validate_agent_type_loads_agents_once() -> None:
+    """Test agent types are looked up once and matched case-insensitively."""
+    _available_agents.cache_clear()
+    try:
+        with patch(
+            "open_agent_kit.services.agent_service.AgentService.list_available_agents",
+            return_value=["claude", "copilot"],
+        ) as list_agents:
+            assert validate_agent_type("Claude")
+            assert validate_agent_type("copilot")
+            assert not validate_agent_type("unknown")
+
+        list_agents.assert_called_once()
+    finally:
+        _available_agents.cache_clear()